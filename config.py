@@ -36,6 +36,16 @@ LOG_LEVEL = getattr(logging, LOG_LEVEL_NAME, logging.INFO)
 IS_DEBUG_MODE = os.getenv("IS_DEBUG_MODE", "False").lower() == "true" # .lower() == "true" 確保任何大小寫的 "true" 都會被正確解析
 # 是否啟用每日推播
 ENABLE_DAILY_NOTIFICATIONS = os.getenv("ENABLE_DAILY_NOTIFICATIONS", "False").lower() == "true"
+# 是否在驗證簽名後立即回應 Webhook，並在背景執行緒中處理事件
+# 只能在 CPU 一律分配的環境啟用：部署到 Cloud Run 時必須加上 `--no-cpu-throttling`
+# 否則回應送出後 CPU 會被限制，背景回覆會拖過 reply token 的有效時間，執行個體停止時尚未處理的事件也會遺失
+ENABLE_WEBHOOK_FAST_ACK = os.getenv("ENABLE_WEBHOOK_FAST_ACK", "False").lower() == "true"
+WEBHOOK_WORKER_THREADS = 8 # 快速回應模式下處理 Webhook 事件的背景執行緒數量
+WEBHOOK_MAX_PENDING = 32   # 快速回應模式下最多允許排隊等待背景處理的 Webhook 請求數量，超過時改為在請求中直接處理
+
+# gunicorn 每個工作程序的請求執行緒數量，與 gunicorn.conf.py 使用同一個環境變數和預設值
+# 同時發出多個 API 請求的執行緒池會依照這個數量決定大小
+GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", 8))
 
 # --- 建立全域 Logger 設定函式 ---
 def setup_logging() -> None:
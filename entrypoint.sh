@@ -22,4 +22,5 @@ echo "Starting application..."
 # --bind 0.0.0.0:${PORT:-8080} 告訴 gunicorn 監聽所有網路接口 (0.0.0.0)，並使用環境變數 PORT 指定的埠號
 # 如果 PORT 環境變數未設定，則使用預設的 8080 埠號，這是 Cloud Run 的標準設定
 # main:app 代表在 main.py 檔案中，找到一個名為 app 的 Flask 應用程式實例來運行
+# 工作程序數量、執行緒和逾時時間等設定由同目錄下的 gunicorn.conf.py 提供，gunicorn 啟動時會自動讀取
 exec gunicorn --bind 0.0.0.0:${PORT:-8080} main:app
\ No newline at end of file
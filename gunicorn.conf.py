@@ -0,0 +1,23 @@
+# gunicorn.conf.py
+"""
+gunicorn 伺服器的設定檔。
+gunicorn 啟動時會自動讀取目前工作目錄下的 `gunicorn.conf.py`，因此 entrypoint.sh 不需要額外指定設定檔路徑。
+未提供設定檔時，gunicorn 只會啟動 1 個 sync worker，所有 Webhook 和推播請求都必須排隊，一次只能處理一個。
+主要設定：
+1. 使用 gthread worker：每個工作程序有多個執行緒，呼叫 LINE API 和中央氣象署 API 等待回應時，其他請求仍可以被處理。
+2. 工作程序數量：預設只啟動 1 個工作程序，以執行緒數量擴充併發能力，兩者都可以用環境變數覆寫，方便依照雲端服務的資源配置調整。
+   天氣資料的 TTL 快取、lru_cache 和執行緒池都存在各自的工作程序中，工作程序越多，快取命中率越低、記憶體用量也越高。
+3. 逾時時間：推播任務需要逐一查詢用戶設定並發送訊息，執行時間可能超過 gunicorn 預設的 30 秒，因此放寬逾時時間。
+"""
+import os
+
+# --- 工作程序與執行緒 ---
+# 不使用 gevent：firebase-admin 底層使用 gRPC，與 gevent 的 monkey patch 不相容
+worker_class = "gthread"
+# 請求大多在等待外部 API 回應（I/O 密集），由同一個工作程序的多個執行緒處理，讓所有請求共用同一份記憶體快取
+workers = int(os.getenv("GUNICORN_WORKERS", 1))
+threads = int(os.getenv("GUNICORN_THREADS", 8)) # config.py 以同一個環境變數決定 API 請求執行緒池的大小
+
+# --- 連線與逾時 ---
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120)) # 推播任務可能執行較久，避免工作程序被強制重啟
+keepalive = 30                                    # 保持與前端負載平衡器之間的連線，減少重新建立連線的次數
@@ -5,7 +5,7 @@
 """
 import logging
 from utils.api_helper import get_messaging_api
-from utils.firestore_manager import set_user_state
+from utils.firestore_manager import set_user_state, set_user_following
 from utils.line_common_messaging import send_hello_message
 from rich_menu_manager.rich_menu_helper import get_rich_menu_id
 
@@ -23,6 +23,12 @@ def handle(event):
     reply_token = event.reply_token
     line_bot_api = get_messaging_api()
 
+    # --- 記錄用戶重新追蹤，恢復原本開啟的推播 ---
+    try:
+        set_user_following(user_id, True)
+    except Exception as e:
+        logger.error(f"記錄用戶 {user_id} 追蹤狀態時發生錯誤: {e}", exc_info=True)
+
     # --- 發送 Flex 歡迎訊息 ---
     send_hello_message(line_bot_api, user_id, reply_token)
 
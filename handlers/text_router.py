@@ -34,27 +34,23 @@ DISPATCH_STATE = {
     "awaiting_today_city_input"    : "handlers.city_input_handler"
 }
 
+# --- 狀態 → (模組路徑, 處理函式名稱) ---
+# 處理函式名稱固定為 `handle_{state}`，在模組載入時一次組好，路由時只需要一次字典查詢，不必每則訊息都重新組字串
+RESOLVED_STATE = {state: (module_path, f"handle_{state}") for state, module_path in DISPATCH_STATE.items()}
+
 """
-這兩個字典定義了當用戶輸入精確的關鍵字時，應該將訊息導向到哪個模組和哪個函式進行處理。
+這個字典定義了當用戶輸入精確的關鍵字時，應該將訊息導向到哪個模組和哪個函式進行處理。
 允許機器人直接響應用戶輸入的特定指令。
 這種模式是 `postback_router` 的文字版，提供用戶透過文字指令來觸發功能，並將關鍵字與處理邏輯分離，使程式碼更易於維護。
+每個關鍵字對應一個 `(模組路徑, 處理函式名稱)` 的元組，路由時只需要一次字典查詢就能同時取得兩者。
 """
-# --- 關鍵字 → handler ---
-DISPATCH_KEYWORD = {
-    "即時天氣" : "weather_current.current_handler",
-    "未來預報" : "weather_forecast.forecast_handler",
-    "颱風現況" : "typhoon.typhoon_handler",
-    "地區影響預警" : "typhoon.area_hazard_handler",
-    "今日天氣" : "weather_today.today_handler"
-}
-
-# --- 關鍵字 → 處理函式名稱 ---
-DISPATCH_KEYWORD_HANDLERS = { # 這裡的處理函式名稱需和各個 handler.py 檔案中的函式名稱保持一致
-    "即時天氣" : "handle_current_message",
-    "未來預報" : "handle_forecast_message",
-    "颱風現況" : "handle_typhoon_message",
-    "地區影響預警" : "handle_area_hazard_message",
-    "今日天氣" : "handle_today_message"
+# --- 關鍵字 → (模組路徑, 處理函式名稱) ---
+DISPATCH_KEYWORD = { # 這裡的處理函式名稱需和各個 handler.py 檔案中的函式名稱保持一致
+    "即時天氣"     : ("weather_current.current_handler", "handle_current_message"),
+    "未來預報"     : ("weather_forecast.forecast_handler", "handle_forecast_message"),
+    "颱風現況"     : ("typhoon.typhoon_handler", "handle_typhoon_message"),
+    "地區影響預警" : ("typhoon.area_hazard_handler", "handle_area_hazard_message"),
+    "今日天氣"     : ("weather_today.today_handler", "handle_today_message")
 }
 
 # --- 忽略 Postback 文字的列表 ---
@@ -62,12 +58,15 @@ DISPATCH_KEYWORD_HANDLERS = { # 這裡的處理函式名稱需和各個 handler.
 LINE 的行為是當用戶點擊 Postback 按鈕時，Bot 會同時收到一個 PostbackEvent 和一個包含按鈕顯示文字的 MessageEvent。
 為了避免機器人對同一個動作發送兩次回覆，這裡會列出所有 Rich Menu Postback 按鈕上的文字，並在收到這些文字訊息時，直接忽略不處理。
 """
-POSTBACK_RELATED_TEXTS_TO_IGNORE = [
+POSTBACK_RELATED_TEXTS_TO_IGNORE = frozenset([
     "天氣查詢", "颱風專區", "生活提醒", "設定", "回首頁",
     "颱風路徑圖", "穿搭建議", "週末天氣", "節氣小知識",
     "每日天氣推播", "颱風通知推播", "週末天氣推播", "節氣小知識推播",
     "切換預設城市"
-]
+])
+
+# 忽略文字中最長的長度，超過這個長度的訊息不可能是 Postback 按鈕文字，可以直接跳過集合查詢
+_MAX_IGNORE_LEN = max(len(text) for text in POSTBACK_RELATED_TEXTS_TO_IGNORE)
 
 # --- 通用函式：安全的從指定模組中調用指定的處理函式 ---
 def _call_handler(module_path: str, handler_name: str, api, event) -> bool:
@@ -115,28 +114,22 @@ def handle(event):
     當用戶點擊 Rich Menu 按鈕時，LINE 會發送一個 Postback 事件和一個文字訊息事件（文字內容就是按鈕上的文字）。
     Postback 事件會被 `postback_router` 處理，為了防止 `text_router` 再次處理這個文字訊息並發送重複的回覆，會在這裡檢查訊息內容，如果它與任何 Postback 按鈕的文字相同，就直接終止處理。
     """
-    if message_text in POSTBACK_RELATED_TEXTS_TO_IGNORE:
+    if len(message_text) <= _MAX_IGNORE_LEN and message_text in POSTBACK_RELATED_TEXTS_TO_IGNORE:
         logger.info(f"[TextRouter] 偵測到 Postback 相關文字 '{message_text}'，由 TextRouter 忽略以避免重複回覆。")
         return # 直接返回，不進行後續處理，因為 Postback 事件已經被 postback_router 處理
     
     # 優先級 2：處理精確匹配的「全局關鍵字」
     """
     處理用戶直接輸入的關鍵字指令，例如「即時天氣」。
-    這裡會根據 `DISPATCH_KEYWORD` 和 `DISPATCH_KEYWORD_HANDLERS` 字典，找到對應的模組和函式名稱，並使用 `_call_handler` 來動態執行。
+    這裡會根據 `DISPATCH_KEYWORD` 字典，一次取得對應的模組和函式名稱，並使用 `_call_handler` 來動態執行。
     這種設計可以讓用戶直接跳過 Rich Menu，快速達到目的。
     """
-    if message_text in DISPATCH_KEYWORD:
-        module_path = DISPATCH_KEYWORD[message_text]
-        handler_name = DISPATCH_KEYWORD_HANDLERS.get(message_text)
-    
-        if handler_name:
-            logger.info(f"偵測到精確匹配關鍵字 '{message_text}'，導向至 {module_path}.{handler_name}。")
-            _call_handler(module_path, handler_name, api, event)
-            return
-        else:
-            logger.error(f"關鍵字 '{message_text}' 沒有對應的處理函式名稱。")
-            _call_handler("handlers.default", "handle", api, event)
-            return
+    keyword_entry = DISPATCH_KEYWORD.get(message_text)
+    if keyword_entry:
+        module_path, handler_name = keyword_entry
+        logger.info(f"偵測到精確匹配關鍵字 '{message_text}'，導向至 {module_path}.{handler_name}。")
+        _call_handler(module_path, handler_name, api, event)
+        return
 
     # 優先級 3：優先處理用戶處於特定「狀態」下的輸入
     """
@@ -144,9 +137,9 @@ def handle(event):
     確保當用戶處於特定狀態時（例如被要求輸入城市名稱），機器人的反應會按照預期的流程進行，而不會被其他的關鍵字或預設處理器干擾。
     這種狀態優先的設計，使得 Bot 的對話流程能夠更加清晰和可控。
     """
-    if state in DISPATCH_STATE:
-        module_path = DISPATCH_STATE[state]
-        handler_name = f"handle_{state}"
+    state_entry = RESOLVED_STATE.get(state)
+    if state_entry:
+        module_path, handler_name = state_entry
         logger.info(f"依照用戶狀態 '{state}' 導向至 {module_path}.{handler_name}。")
         _call_handler(module_path, handler_name, api, event)
         return
@@ -0,0 +1,21 @@
+# handlers/unfollow.py
+"""
+這個檔案主要負責處理用戶解除追蹤（unfollow）或封鎖 Line Bot 的事件。
+用戶解除追蹤後，機器人無法再推播訊息給他，因此記錄他已解除追蹤，讓之後的推播任務在篩選用戶時就直接略過他。
+只記錄追蹤狀態，不修改推播設定；用戶重新追蹤時，follow.py 會將狀態改回追蹤中，原本開啟的推播會自動恢復。
+"""
+import logging
+from utils.firestore_manager import set_user_following
+
+logger = logging.getLogger(__name__)
+
+def handle(event):
+    """
+    這是解除追蹤事件的處理函式。
+    解除追蹤事件沒有 reply_token，不需要回覆任何訊息，只更新資料庫中的追蹤狀態。
+    """
+    user_id = event.source.user_id
+    try:
+        set_user_following(user_id, False)
+    except Exception as e:
+        logger.error(f"記錄用戶 {user_id} 解除追蹤時發生錯誤: {e}", exc_info=True)
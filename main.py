@@ -10,7 +10,10 @@
 """
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, abort
+from functools import lru_cache
 from importlib import import_module
 
 from linebot.v3.webhook import WebhookHandler
@@ -21,7 +24,10 @@ from linebot.v3.webhooks.models import (
 
 # 專案共用設定
 from utils.api_helper import get_line_bot_apis
-from config import LINE_CHANNEL_SECRET, IS_DEBUG_MODE, ENABLE_DAILY_NOTIFICATIONS
+from config import (
+    LINE_CHANNEL_SECRET, IS_DEBUG_MODE, ENABLE_DAILY_NOTIFICATIONS,
+    ENABLE_WEBHOOK_FAST_ACK, WEBHOOK_WORKER_THREADS, WEBHOOK_MAX_PENDING
+)
 
 # Rich Menu 別名常數
 from rich_menu_manager.rich_menu_configs import (
@@ -33,12 +39,6 @@ from rich_menu_manager.rich_menu_configs import (
 # 導入初始化函式
 from main_initializer import initialize
 
-# 導入推播任務的模組，這些函式由 Cloud Scheduler 觸發
-from push_modules.push_solar_terms import push_solar_terms_notification
-from push_modules.push_daily_weather import push_daily_weather_notification
-from push_modules.push_weekend_weather import push_weekend_weather_notification
-from push_modules.push_typhoon_notification import check_and_push_typhoon_notification
-
 # 設定日誌系統，確保所有日誌都輸出到控制台
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -72,27 +72,58 @@ def health_check():
 """
 將來自 LINE 的不同事件類型（例如文字訊息、追蹤、回傳資料）導向到對應的處理模組。
 使用 `import_module` 動態導入模組，而不是在檔案開頭全部導入，這樣可以延遲加載，讓主檔案更輕量，啟動更快。
+第一次收到事件時才導入模組，之後直接使用快取的 `handle` 函式，不需要每個事件都重新查找模組和屬性。
 """
+# 取得指定處理模組的 handle 函式，並快取結果
+@lru_cache(maxsize=None)
+def _get_event_handler(module_name: str):
+    return import_module(module_name).handle
+
 # 處理文字訊息事件，將其路由到 handlers.text_router 模組的 handle 函式
 @handler.add(MessageEvent, message=TextMessageContent)
 def on_text(event):
-    import_module("handlers.text_router").handle(event)
+    _get_event_handler("handlers.text_router")(event)
 
 # 處理用戶追蹤機器人事件，將其路由到 handlers.follow 模組的 handle 函式
 @handler.add(FollowEvent)
 def on_follow(event):
-    import_module("handlers.follow").handle(event)
+    _get_event_handler("handlers.follow")(event)
     logger.info(f"用戶 {event.source.user_id} 追蹤了機器人。")
 
-# 處理用戶解除追蹤事件，這裡只簡單的記錄日誌，沒有複雜的處理邏輯
+# 處理用戶解除追蹤事件，將其路由到 handlers.unfollow 模組的 handle 函式，記錄該用戶已解除追蹤，推播任務會略過他
 @handler.add(UnfollowEvent)
 def handle_unfollow(event):
+    _get_event_handler("handlers.unfollow")(event)
     logger.info(f"用戶 {event.source.user_id} 解除了追蹤。")
 
 # 處理用戶點擊 Rich Menu 或模板訊息按鈕後傳送的 Postback 事件，將其路由到 handlers.postback_router 模組的 handle 函式
 @handler.add(PostbackEvent)
 def on_postback(event):
-    import_module("handlers.postback_router").handle(event)
+    _get_event_handler("handlers.postback_router")(event)
+
+# --- Webhook 背景處理 ---
+"""
+LINE 平台在 Webhook 回應過慢時會重新傳送事件。
+啟用 `ENABLE_WEBHOOK_FAST_ACK` 時，`/callback` 只在請求執行緒中驗證簽名，驗證通過就立即回應 "OK"，
+事件的分發和後續的 API 呼叫交給背景執行緒處理；reply token 的有效時間足夠背景執行緒完成回覆。
+背景執行緒仍然透過 `handler.handle` 分發事件，SDK 會再驗證一次簽名；這只多花費一次 HMAC 計算，但不需要依賴 SDK 內部的分發邏輯。
+注意事項：
+1. 回應送出後仍在執行的工作需要 CPU，部署到 Cloud Run 時必須使用 `--no-cpu-throttling`（CPU 一律分配）。
+   否則 CPU 會被限制，背景回覆會拖過 reply token 的有效時間；執行個體停止時，尚未處理的事件也會遺失。
+2. 執行緒池的佇列本身沒有上限，因此用 `_webhook_slots` 限制「執行中 + 排隊中」的請求數量。
+   名額用完時記錄警告，改為在請求執行緒中直接處理，讓佇列不會無限制的增加，事件也不會被丟棄。
+"""
+_webhook_executor = ThreadPoolExecutor(max_workers=WEBHOOK_WORKER_THREADS, thread_name_prefix="webhook") if ENABLE_WEBHOOK_FAST_ACK else None
+_webhook_slots = threading.BoundedSemaphore(WEBHOOK_WORKER_THREADS + WEBHOOK_MAX_PENDING) if ENABLE_WEBHOOK_FAST_ACK else None
+
+# 在背景執行緒中分發事件，錯誤只能記錄在日誌中，因為回應已經送出
+def _handle_webhook_in_background(body: str, sig: str) -> None:
+    try:
+        handler.handle(body, sig)
+    except Exception as e:
+        logger.error("背景處理 Webhook 事件時發生錯誤。", exc_info=True)
+    finally:
+        _webhook_slots.release() # 處理完成後歸還名額
 
 # --- Flask Webhook ---
 """
@@ -104,7 +135,23 @@ LINE 會向這個 URL 發送所有用戶互動事件。
 def callback():
     sig  = request.headers.get("X-Line-Signature", "") # 從 HTTP Headers 獲取簽名
     body = request.get_data(as_text=True)              # 獲取請求主體，轉成文字格式
-    
+
+    # 快速回應模式：簽名驗證通過後立即回應，事件交給背景執行緒處理
+    if _webhook_executor is not None:
+        if not handler.parser.signature_validator.validate(body, sig): # 使用 SDK 的簽名驗證器，與 `handler.handle` 的驗證方式相同
+            logger.warning("Webhook 簽名驗證失敗。")
+            abort(400)
+        if _webhook_slots.acquire(blocking=False):
+            try:
+                _webhook_executor.submit(_handle_webhook_in_background, body, sig)
+                return "OK"
+            except RuntimeError: # 執行緒池已關閉（工作程序正在結束），歸還名額後改為直接處理
+                _webhook_slots.release()
+                logger.warning("Webhook 背景執行緒池已關閉，改為在請求中直接處理事件。")
+        else:
+            # 背景佇列已滿，改為直接在請求中處理（下方的一般流程）
+            logger.warning("Webhook 背景佇列已滿，改為在請求中直接處理事件。")
+
     # 執行 handler 的 handle 函式來分發事件
     try:
         handler.handle(body, sig)
@@ -161,54 +208,64 @@ except Exception as e:
 """
 這些路由專門設計給外部排程服務（例如 Google Cloud Scheduler）呼叫。
 當 Cloud Scheduler 定時發送 HTTP 請求到這些 URL 時，會觸發對應的推播任務。
+推播任務的模組在路由第一次被呼叫時才導入，與事件處理模組一樣延遲加載，讓冷啟動時的 /health 和 /callback 不需要等待推播相關的模組載入。
 """
-# 由 Cloud Scheduler 定時觸發，執行每日天氣推播任務
-# 呼叫 `push_daily_weather_notification` 函式，向用戶推播每日天氣預報
-@app.route("/push_daily_weather", methods=["GET"])
-def push_daily_weather():
+# 推播任務名稱 → (模組路徑, 函式名稱, 任務說明)
+_PUSH_JOBS = {
+    "daily"   : ("push_modules.push_daily_weather",        "push_daily_weather_notification",     "每日天氣推播"),
+    "solar"   : ("push_modules.push_solar_terms",          "push_solar_terms_notification",       "節氣推播"),
+    "typhoon" : ("push_modules.push_typhoon_notification", "check_and_push_typhoon_notification", "颱風推播"),
+    "weekend" : ("push_modules.push_weekend_weather",      "push_weekend_weather_notification",   "週末天氣推播")
+}
+
+# 執行單一推播任務，回傳 (回應訊息, HTTP 狀態碼)
+def _run_push_job(job_name: str):
+    module_name, func_name, job_label = _PUSH_JOBS[job_name]
     try:
-        logger.info("Cloud Scheduler 觸發每日天氣推播任務。")
-        push_daily_weather_notification(line_bot_api_instance=line_bot_api_instance)
-        return "每日天氣推播成功。", 200
+        logger.info(f"Cloud Scheduler 觸發{job_label}任務。")
+        push_func = getattr(import_module(module_name), func_name)
+        push_func(line_bot_api_instance=line_bot_api_instance)
+        return f"{job_label}成功。", 200
     except Exception as e:
-        logger.error("每日天氣推播任務執行失敗。", exc_info=True)
-        return f"每日天氣推播出現錯誤: {str(e)}", 500
+        logger.error(f"{job_label}任務執行失敗。", exc_info=True)
+        return f"{job_label}出現錯誤: {str(e)}", 500
+
+# 一次執行多個推播任務，例如 /push?jobs=solar,daily
+"""
+排程服務可以把同一時間要執行的任務合併成一個請求，服務從零啟動時只需要經歷一次冷啟動，所有任務也共用同一個 LINE API 連線池。
+任務依照參數中的順序依次執行，某個任務失敗不會影響其他任務；只要有任何一個任務失敗，就回傳 500。
+"""
+@app.route("/push", methods=["GET"])
+def push_jobs():
+    job_names = [name.strip() for name in request.args.get("jobs", "").split(",") if name.strip()]
+    unknown_jobs = [name for name in job_names if name not in _PUSH_JOBS]
+    if not job_names or unknown_jobs:
+        return f"未知或缺少的推播任務: {', '.join(unknown_jobs) or '(無)'}。可用的任務: {', '.join(_PUSH_JOBS)}", 400
+
+    results = [_run_push_job(name) for name in job_names]
+    status_code = 500 if any(code != 200 for _, code in results) else 200
+    return "\n".join(message for message, _ in results), status_code
+
+# 以下路由保留給既有的排程設定使用，每個路由只執行對應的單一推播任務
+# 每日天氣推播：向用戶推播每日天氣預報
+@app.route("/push_daily_weather", methods=["GET"])
+def push_daily_weather():
+    return _run_push_job("daily")
 
-# 由 Cloud Scheduler 定時觸發，執行節氣推播任務
-# 呼叫 `push_solar_terms_notification` 函式，向用戶推播節氣通知
+# 節氣推播：向用戶推播節氣通知
 @app.route("/push_solar_terms", methods=["GET"])
 def push_solar_terms():
-    try:
-        logger.info("Cloud Scheduler 觸發節氣推播任務。")
-        push_solar_terms_notification(line_bot_api_instance=line_bot_api_instance)
-        return "節氣推播成功。", 200
-    except Exception as e:
-        logger.error("節氣推播任務執行失敗。", exc_info=True)
-        return f"節氣推播出現錯誤: {str(e)}", 500
+    return _run_push_job("solar")
 
-# 由 Cloud Scheduler 定時觸發，執行颱風推播任務
-# 呼叫 `check_and_push_typhoon_notification` 函式，檢查是否有颱風警報並推播給用戶
+# 颱風推播：檢查是否有颱風警報並推播給用戶
 @app.route("/push_typhoon_notification", methods=["GET"])
 def push_typhoon_notification():
-    try:
-        logger.info("Cloud Scheduler 觸發颱風推播任務。")
-        check_and_push_typhoon_notification(line_bot_api_instance=line_bot_api_instance)
-        return "颱風推播成功。", 200
-    except Exception as e:
-        logger.error("颱風推播任務執行失敗。", exc_info=True)
-        return f"颱風推播出現錯誤: {str(e)}", 500
+    return _run_push_job("typhoon")
 
-# 由 Cloud Scheduler 定時觸發，執行週末天氣推播任務
-# 呼叫 `push_weekend_weather_notification` 函式，向用戶推播週末天氣預報
+# 週末天氣推播：向用戶推播週末天氣預報
 @app.route("/push_weekend_weather", methods=["GET"])
 def push_weekend_weather():
-    try:
-        logger.info("Cloud Scheduler 觸發週末天氣推播任務。")
-        push_weekend_weather_notification(line_bot_api_instance=line_bot_api_instance)
-        return "週末天氣推播成功。", 200
-    except Exception as e:
-        logger.error("週末天氣推播任務執行失敗。", exc_info=True)
-        return f"週末天氣推播出現錯誤: {str(e)}", 500
+    return _run_push_job("weekend")
 
 # --- 啟動 Flask ---
 # 本機測試才用 Flask，部署到雲端用 gunicorn 伺服器
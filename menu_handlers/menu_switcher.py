@@ -35,12 +35,24 @@ _alias_map = {
     "settings" : SETTINGS_ALIAS
 }
 
+# --- 選單文字 → Rich Menu 別名 ---
+# 由別名表決定，只有在 `init_menu_aliases` 更新別名表時才需要重新建立，不必每則訊息都重新組一次字典
+def _build_menu_switch_map(alias_map: dict) -> dict:
+    return {
+        "天氣查詢" : alias_map.get("weather"),
+        "颱風專區" : alias_map.get("typhoon"),
+        "生活提醒" : alias_map.get("life"),
+        "設定"     : alias_map.get("settings")
+    }
+
+_menu_switch_map = _build_menu_switch_map(_alias_map)
+
 # --- 初始化 Rich Menu 別名映射表的函式 ---
 def init_menu_aliases(main_alias, weather_alias, typhoon_alias, life_alias, settings_alias):
     """
     在應用程式啟動時，將外部設定的 Rich Menu 別名，注入到本模組的 `_alias_map` 字典中，供後續的 handle_menu_switching 選單切換函式使用。
     """
-    global _alias_map
+    global _alias_map, _menu_switch_map
     _alias_map = {
         "main"     : main_alias,
         "weather"  : weather_alias,
@@ -48,12 +60,21 @@ def init_menu_aliases(main_alias, weather_alias, typhoon_alias, life_alias, sett
         "life"     : life_alias,
         "settings" : settings_alias
     }
+    _menu_switch_map = _build_menu_switch_map(_alias_map)
     logger.info(f"menu_switcher: _alias_map 已初始化 → {_alias_map}")
 
+# --- 從 LINE API 取得的 Rich Menu ID 快取 ---
+"""
+本地的 `rich_menu_ids.json` 沒有某個別名時，每次切換選單都必須呼叫 LINE API 查詢別名對應的 ID，多一次網路往返。
+將查詢到的 ID 暫存在記憶體中，同一個工作程序之後切換到相同選單時就不需要再查詢。
+綁定失敗時會移除該別名的快取，下一次切換時重新向 LINE API 查詢，避免選單重新部署後一直使用過期的 ID。
+"""
+_api_alias_id_cache: dict[str, str] = {}
+
 # --- 私有輔助函式：用於根據 Rich Menu 的別名來獲取 ID 並將選單綁定給指定的用戶 ---
 def _link_rich_menu_by_alias(line_bot_api: MessagingApi, user_id: str, alias_id: str) -> bool:
     """
-    此函式會先嘗試從本地的 JSON 檔案中獲取 Rich Menu ID，如果找不到，才會呼叫 LINE API 獲取。
+    此函式會先嘗試從本地的 JSON 檔案中獲取 Rich Menu ID，如果找不到，再使用之前從 LINE API 查詢過的結果，都沒有時才會呼叫 LINE API 獲取。
     這種設計可以減少對 LINE API 的頻繁呼叫，提高效率。
     函式也包含了錯誤處理機制，確保即使綁定失敗，也不會導致程式崩潰。
     """
@@ -62,10 +83,13 @@ def _link_rich_menu_by_alias(line_bot_api: MessagingApi, user_id: str, alias_id:
         # 先檢查本地的 `rich_menu_ids.json` 檔案是否有 Rich Menu ID，如果有，就直接使用，避免不必要的 API 呼叫
         rich_menu_id = get_rich_menu_id(alias_id)
 
-        # 2. 若 JSON 取不到，再呼叫 LINE API 來獲取 ID（避免第一次啟動沒有 JSON）
+        # 2. 若 JSON 取不到，先查詢記憶體快取，再呼叫 LINE API 來獲取 ID（避免第一次啟動沒有 JSON）
+        if not rich_menu_id:
+            rich_menu_id = _api_alias_id_cache.get(alias_id)
         if not rich_menu_id:
             alias_info = line_bot_api.get_rich_menu_alias(alias_id)
             rich_menu_id = alias_info.rich_menu_id
+            _api_alias_id_cache[alias_id] = rich_menu_id
             logger.warning(f"從 LINE API 取得 Rich Menu ID '{rich_menu_id}' (別名 '{alias_id}')，請確保 rich_menu_ids.json 已更新。")
 
         # 3. 使用獲取到的 Rich Menu ID 綁定給用戶
@@ -73,9 +97,11 @@ def _link_rich_menu_by_alias(line_bot_api: MessagingApi, user_id: str, alias_id:
         logger.info(f"成功將 Rich Menu ID '{rich_menu_id}' (來自別名 '{alias_id}') 綁定給用戶 '{user_id}'。")
         return True
     except InvalidSignatureError as e:
+        _api_alias_id_cache.pop(alias_id, None) # 快取的 ID 可能已經失效，下次重新查詢
         logger.error(f"LINE API 錯誤：無法綁定 '{alias_id}' -> {e}", exc_info=True)
         return False
     except Exception as e:
+        _api_alias_id_cache.pop(alias_id, None)
         logger.error(f"未知錯誤：綁定 '{alias_id}' 失敗 -> {e}", exc_info=True)
         return False
 
@@ -108,17 +134,10 @@ def handle_menu_switching(event: MessageEvent, line_bot_api: MessagingApi) -> bo
     user_id = event.source.user_id
     reply_token = event.reply_token
 
-    menu_switch_map = {
-        "天氣查詢" : _alias_map.get("weather"),
-        "颱風專區" : _alias_map.get("typhoon"),
-        "生活提醒" : _alias_map.get("life"),
-        "設定" : _alias_map.get("settings")
-    }
-
-    # 檢查事件是否為文字訊息，然後根據 `menu_switch_map` 字典將文字訊息（例如「天氣查詢」）對應到 Rich Menu 的別名
-    if text in menu_switch_map:
+    # 檢查事件是否為文字訊息，然後根據 `_menu_switch_map` 字典將文字訊息（例如「天氣查詢」）對應到 Rich Menu 的別名
+    if text in _menu_switch_map:
         # 2. 檢查是否有匹配的選單文字
-        target_alias = menu_switch_map[text]
+        target_alias = _menu_switch_map[text]
         logger.info(f"嘗試切換到 '{text}' 選單 (別名: {target_alias})，用戶: {user_id}")
 
         if _link_rich_menu_by_alias(line_bot_api, user_id, target_alias):
@@ -6,6 +6,7 @@
 這種模組化設計確保了天氣資料的解析和穿搭邏輯是分開的，提高了程式碼的可維護性。
 """
 import logging
+from bisect import bisect_right
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,30 @@ IMAGE_URLS = {
     "COMFORTABLE"   : "https://i.postimg.cc/HLVtmjB5/COMFORTABLE.png"
 }
 
+# --- 不可被濕度圖片覆蓋的圖片集合 ---
+# 濕度建議只有在目前的圖片不屬於這些較優先的情境時，才會更換圖片
+_KEEP_FOR_HIGH_HUMIDITY = frozenset({IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"]})
+_KEEP_FOR_DRY_WEATHER = frozenset({IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_CURRENT"]})
+
+# --- 可被紫外線圖片取代的圖片集合 ---
+# 只有在目前的圖片屬於一般溫度情境時，紫外線建議才會把圖片換成高紫外線圖片
+# 這些集合是固定的，在模組載入時建立一次即可，不需要在每次判斷中重複建立列表
+_REPLACEABLE_BY_EXTREME_UVI = frozenset({IMAGE_URLS["DEFAULT"], IMAGE_URLS["HOT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]})
+_REPLACEABLE_BY_HIGH_UVI = frozenset({IMAGE_URLS["DEFAULT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]})
+
+# --- 體感溫度區間對照表 ---
+# 區間下限由低到高排列，`bisect_right` 找到的位置就是對應的建議索引，邊界值歸入較高的區間（例如 28 度屬於「炎熱」），與原本 `>=` 的判斷方式相同
+_FEELS_LIKE_THRESHOLDS = (10, 14, 19, 24, 28, 32)
+_FEELS_LIKE_SUGGESTIONS = (
+    ("• 天氣非常寒冷，建議穿著羽絨外套、厚毛衣、圍巾、手套，做好全面保暖！", IMAGE_URLS["FREEZING"]), # < 10
+    ("• 天氣寒冷，請穿著厚外套、毛衣，務必注意保暖。", IMAGE_URLS["COLD"]),                          # 10 ~ 14
+    ("• 天氣微涼，建議穿著毛衣或較厚的外套，注意保暖。", IMAGE_URLS["CHILLY"]),                      # 14 ~ 19
+    ("• 天氣涼爽，建議穿著薄長袖上衣或薄外套，夜晚可能稍涼。", IMAGE_URLS["COOL"]),                  # 19 ~ 24
+    ("• 天氣溫暖舒適，穿著短袖即可，室內外溫差大，可備薄外套。", IMAGE_URLS["WARM"]),                # 24 ~ 28
+    ("• 天氣炎熱，建議穿著涼爽的短袖、短褲或裙子。", IMAGE_URLS["HOT"]),                             # 28 ~ 32
+    ("• 天氣極度炎熱，請務必穿著最輕薄、透氣的衣物。", IMAGE_URLS["HOT"])                            # >= 32
+)
+
 def get_outfit_suggestion_for_current_weather(current_weather_data: dict) -> dict:
     """
     根據即時天氣數據 (來自 weather_current_parser.py 的輸出格式) 提供穿搭建議。
@@ -83,30 +108,12 @@ def get_outfit_suggestion_for_current_weather(current_weather_data: dict) -> dic
     # --- 根據體感溫度給出穿搭建議 ---
     """
     為了根據不同溫度的區間，提供不同層次的穿搭建議。
-    這種多層次的 `if/elif` 判斷可以確保建議的精確性，從炎熱的短袖到嚴寒的羽絨外套，每個溫度範圍都有對應的文字建議和圖片。
+    從炎熱的短袖到嚴寒的羽絨外套，每個溫度範圍都有對應的文字建議和圖片。
+    區間和建議定義在模組層級的 `_FEELS_LIKE_THRESHOLDS` 和 `_FEELS_LIKE_SUGGESTIONS`，這裡只需要一次二分搜尋就能找到對應的建議。
     """
-    if feels_like is not None:
-        if feels_like >= 32:
-            suggestion_text.append("• 天氣極度炎熱，請務必穿著最輕薄、透氣的衣物。")
-            suggestion_image_url = IMAGE_URLS["HOT"]
-        elif 28 <= feels_like < 32:
-            suggestion_text.append("• 天氣炎熱，建議穿著涼爽的短袖、短褲或裙子。")
-            suggestion_image_url = IMAGE_URLS["HOT"]
-        elif 24 <= feels_like < 28:
-            suggestion_text.append("• 天氣溫暖舒適，穿著短袖即可，室內外溫差大，可備薄外套。")
-            suggestion_image_url = IMAGE_URLS["WARM"]
-        elif 19 <= feels_like < 24:
-            suggestion_text.append("• 天氣涼爽，建議穿著薄長袖上衣或薄外套，夜晚可能稍涼。")
-            suggestion_image_url = IMAGE_URLS["COOL"]
-        elif 14 <= feels_like < 19:
-            suggestion_text.append("• 天氣微涼，建議穿著毛衣或較厚的外套，注意保暖。")
-            suggestion_image_url = IMAGE_URLS["CHILLY"]
-        elif 10 <= feels_like < 14:
-            suggestion_text.append("• 天氣寒冷，請穿著厚外套、毛衣，務必注意保暖。")
-            suggestion_image_url = IMAGE_URLS["COLD"]
-        else: # feels_like < 10
-            suggestion_text.append("• 天氣非常寒冷，建議穿著羽絨外套、厚毛衣、圍巾、手套，做好全面保暖！")
-            suggestion_image_url = IMAGE_URLS["FREEZING"]
+    # 前面已經為 `feels_like` 補上預設值，這裡以及之後的判斷都不需要再檢查 None
+    feels_like_text, suggestion_image_url = _FEELS_LIKE_SUGGESTIONS[bisect_right(_FEELS_LIKE_THRESHOLDS, feels_like)]
+    suggestion_text.append(feels_like_text)
 
     # --- 針對降雨情況進行補充 ---
     """
@@ -128,7 +135,7 @@ def get_outfit_suggestion_for_current_weather(current_weather_data: dict) -> dic
     elif "午後雷陣雨" in weather_phenomenon:
         suggestion_text.append("• 午後可能有雷陣雨，外出請攜帶雨具。")
         suggestion_image_url = IMAGE_URLS["LIGHT_RAIN"]
-    elif "陣雨" in weather_phenomenon or "雷雨" in weather_phenomenon or "雨" in weather_phenomenon:
+    elif "雨" in weather_phenomenon: # 「陣雨」、「雷雨」等描述都包含「雨」，一次子字串檢查即可涵蓋
         suggestion_text.append("• 局部地區可能有短暫降雨，外出建議攜帶雨具。")
         suggestion_image_url = IMAGE_URLS["RAINY_CURRENT"]
     else:
@@ -138,20 +145,20 @@ def get_outfit_suggestion_for_current_weather(current_weather_data: dict) -> dic
     if humidity is not None:
         if humidity >= 85:
             suggestion_text.append("• 濕度極高，體感可能悶熱或濕冷，建議選擇吸濕排汗的衣物。")
-            if suggestion_image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"]]:
+            if suggestion_image_url not in _KEEP_FOR_HIGH_HUMIDITY:
                 suggestion_image_url = IMAGE_URLS["HIGH_HUMIDITY"] # 高濕度圖
         elif humidity >= 70:
-            if feels_like is not None and feels_like >= 25:
+            if feels_like >= 25:
                 suggestion_text.append("• 濕度偏高且氣溫較高，體感可能較為悶熱，建議穿著寬鬆、透氣的衣物。")
             else:
                 suggestion_text.append("• 濕度偏高，空氣較為潮濕，注意衣物選擇透氣性。")
         elif humidity < 40:
             suggestion_text.append("• 空氣較為乾燥，注意肌膚保濕，可考慮攜帶護手霜或補水用品。")
-            if suggestion_image_url not in [IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]]:
+            if suggestion_image_url not in _KEEP_FOR_DRY_WEATHER:
                 suggestion_image_url = IMAGE_URLS["DRY_WEATHER"] # 乾燥天氣圖
 
     # --- 補充風速/風寒建議 (使用蒲福風級數字判斷和描述) ---
-    if beaufort_scale_int is not None and feels_like is not None: # 確保這些值不是None
+    if beaufort_scale_int is not None: # 確保風級不是None
         if beaufort_scale_int >= 7 and feels_like < 20: # 疾風或更高，且氣溫偏涼
             suggestion_text.append(f"• 風力屬於 {wind_speed_beaufort_display}，風寒效應明顯，請特別注意防風保暖，可考慮穿著防風外套。")
             if feels_like < 15:
@@ -169,16 +176,16 @@ def get_outfit_suggestion_for_current_weather(current_weather_data: dict) -> dic
     if uv_index is not None: # 確保 uv_index 不是None
         if uv_index >= 11: # 危險
             suggestion_text.append(f"• 紫外線指數高達 {uv_index_display}！戶外活動務必全程做好防曬，包括防曬乳、帽子、太陽眼鏡、遮陽傘，建議穿著長袖、輕薄透氣的衣物。")
-            if suggestion_image_url in [IMAGE_URLS["DEFAULT"], IMAGE_URLS["HOT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]]:
+            if suggestion_image_url in _REPLACEABLE_BY_EXTREME_UVI:
                 suggestion_image_url = IMAGE_URLS["HIGH_UVI"] # 使用高紫外線圖片
         elif uv_index >= 8: # 過量
             suggestion_text.append(f"• 紫外線指數高達 {uv_index_display}！長時間戶外活動請加強防曬，建議戴太陽眼鏡、遮陽帽，塗抹防曬乳。")
-            if feels_like is not None and feels_like >= 25: # 在炎熱天氣下，紫外線更需要強調防曬衣物
+            if feels_like >= 25: # 在炎熱天氣下，紫外線更需要強調防曬衣物
                 suggestion_text.append("• 可考慮穿著防曬衣物。")
             suggestion_image_url = IMAGE_URLS["HIGH_UVI"]
         elif uv_index >= 6: # 高
             suggestion_text.append(f"• 紫外線指數為 {uv_index_display}，外出建議戴太陽眼鏡、遮陽帽，並塗抹防曬乳。")
-            if suggestion_image_url in [IMAGE_URLS["DEFAULT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]]:
+            if suggestion_image_url in _REPLACEABLE_BY_HIGH_UVI:
                 suggestion_image_url = IMAGE_URLS["HIGH_UVI"]
         elif uv_index >= 3: # 中
             suggestion_text.append(f"• 紫外線指數為 {uv_index_display}，外出可戴太陽眼鏡。")
@@ -209,7 +216,7 @@ def get_outfit_suggestion_for_current_weather(current_weather_data: dict) -> dic
         "humidity": current_weather_data.get('humidity'),                 # 使用已格式化的字串
         "precipitation": current_weather_data.get('precipitation'),       # 使用已格式化的字串
         "wind_speed_beaufort_display": wind_speed_beaufort_display,       # 使用蒲福風級顯示字串
-        "uv_index": current_weather_data.get('uv_index')                  # 使用已格式化的字串
+        "uv_index": uv_index_display                                      # 使用已格式化的字串
     }
 
     logger.debug(f"即時穿搭建議生成及數據回傳: {outfit_info_to_return}")
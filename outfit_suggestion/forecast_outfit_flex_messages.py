@@ -5,11 +5,21 @@
 這種將「數據處理」與「介面生成」分開的設計，讓程式碼結構更清晰，易於維護和修改。
 """
 import logging
-from utils.flex_message_elements import make_kv_row
-from linebot.v3.messaging.models import FlexBox, FlexText, FlexImage, FlexBubble, FlexSeparator
+from utils.flex_message_elements import make_kv_row, make_outfit_hero, SUGGESTION_TEXT_STYLE, SECTION_SEPARATOR
+from linebot.v3.messaging.models import FlexBox, FlexText, FlexBubble
 
 logger = logging.getLogger(__name__)
 
+# --- 天氣資訊區塊的 (標籤, outfit_info 鍵名) ---
+# 依顯示順序排列；欄位缺少時仍保留該行，由 `make_kv_row` 顯示「無資料」，讓每天的卡片排版一致
+_WEATHER_INFO_ROWS = (
+    ("天氣狀況：", "display_weather_desc"),
+    ("體感溫度：", "display_feels_like_temp"),
+    ("濕度：", "display_humidity"),
+    ("降雨機率：", "display_pop"),
+    ("紫外線指數：", "display_uv_index")
+)
+
 def build_forecast_outfit_card(outfit_info: dict, location_name: str, day_offset: int) -> FlexBubble:
     """
     根據提供的穿搭資訊和已經格式化好的天氣數據，來構建一個單天的 Flex Message 卡片。
@@ -51,33 +61,21 @@ def build_forecast_outfit_card(outfit_info: dict, location_name: str, day_offset
     """
     將穿搭建議的文字列表 `suggestion_text` 轉換為一系列的 `FlexText` 物件。
     因為 Flex Message 的內容元件需要是特定的物件（如 `FlexText`）。
-    透過迴圈，為每一條建議文字都生成一個獨立的 `FlexText` 物件，並將其加入列表，以便後續的 `FlexBox` 佈局使用。
+    透過列表生成式，為每一條建議文字都生成一個套用共用樣式 `SUGGESTION_TEXT_STYLE` 的 `FlexText` 物件，以便後續的 `FlexBox` 佈局使用。
     """
-    suggestion_text_contents = []
-    for suggestion in suggestion_text:
-        suggestion_text_contents.append(
-            FlexText(
-                text=suggestion,
-                size="md",
-                color="#333333",
-                wrap=True, # 確保文字在超出範圍時自動換行
-                margin="sm",
-                align="start"
-            )
-        )
+    suggestion_text_contents = [
+        FlexText(text=suggestion, **SUGGESTION_TEXT_STYLE) for suggestion in suggestion_text
+    ]
 
     # --- 天氣資訊區塊內容 ---
     """
     使用一個輔助函式 `make_kv_row` 生成天氣資訊的鍵值對佈局。
     這種方式將常見的鍵值對排版邏輯抽象成一個獨立的函式，讓主函式 `build_forecast_outfit_card` 的程式碼更簡潔，並方便在其他地方重複使用相同的排版。
-    直接使用 forecast_flex_converter.py 預先處理好的顯示字串。
+    直接使用 forecast_flex_converter.py 預先處理好的顯示字串，要顯示的欄位和順序定義在 `_WEATHER_INFO_ROWS`。
     """
-    weather_info_contents = []
-    weather_info_contents.append(make_kv_row("天氣狀況：", outfit_info.get("display_weather_desc")))
-    weather_info_contents.append(make_kv_row("體感溫度：", outfit_info.get("display_feels_like_temp")))
-    weather_info_contents.append(make_kv_row("濕度：", outfit_info.get("display_humidity")))
-    weather_info_contents.append(make_kv_row("降雨機率：", outfit_info.get("display_pop")))
-    weather_info_contents.append(make_kv_row("紫外線指數：", outfit_info.get("display_uv_index")))
+    weather_info_contents = [
+        make_kv_row(label, outfit_info.get(key)) for label, key in _WEATHER_INFO_ROWS
+    ]
 
     # --- 組裝並回傳最終的 `FlexBubble` 物件 ---
     """
@@ -89,17 +87,7 @@ def build_forecast_outfit_card(outfit_info: dict, location_name: str, day_offset
     """
     return FlexBubble(
         direction="ltr",
-        hero=FlexBox(
-            layout="vertical",
-            contents=[
-                FlexImage(
-                    url=suggestion_image_url, 
-                    size="full",
-                    aspectRatio="20:9",
-                    aspectMode="fit"
-                )
-            ]
-        ),
+        hero=make_outfit_hero(suggestion_image_url),
         body=FlexBox(
             layout="vertical",
             contents=[
@@ -118,14 +106,14 @@ def build_forecast_outfit_card(outfit_info: dict, location_name: str, day_offset
                     align="center",
                     margin="none"
                 ),
-                FlexSeparator(margin="md"),
+                SECTION_SEPARATOR, # 分隔線
                 FlexBox(
                     layout="vertical",
                     spacing="sm",
                     margin="md",
                     contents=weather_info_contents # 這裡直接放入 FlexBox 物件列表
                 ),
-                FlexSeparator(margin="md"),
+                SECTION_SEPARATOR, # 分隔線
                 FlexBox(
                     layout="vertical",
                     spacing="sm",
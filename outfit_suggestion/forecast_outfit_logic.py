@@ -28,6 +28,16 @@ IMAGE_URLS = {
     "HIGH_UVI"       : "https://i.postimg.cc/cLDcPfMX/HIGH_UVI.png"
 }
 
+# --- 不可被覆蓋的圖片集合 ---
+# 後面的補充建議（降雨、濕度、風速、紫外線）只有在目前的圖片不屬於這些較優先的情境時，才會更換圖片
+# 這些集合是固定的，在模組載入時建立一次即可，不需要在每一天的判斷中重複建立列表
+_KEEP_FOR_HEAVY_RAIN = frozenset({IMAGE_URLS["HOT"], IMAGE_URLS["COLD"]})
+_KEEP_FOR_RAINY = _KEEP_FOR_HEAVY_RAIN | {IMAGE_URLS["HEAVY_RAIN"]}
+_KEEP_FOR_LIGHT_RAIN_AND_WIND = _KEEP_FOR_RAINY | {IMAGE_URLS["RAINY_FORECAST"]}
+_KEEP_FOR_HUMIDITY = _KEEP_FOR_LIGHT_RAIN_AND_WIND | {IMAGE_URLS["LIGHT_RAIN"]}
+_KEEP_FOR_HIGH_UVI = frozenset({IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]})
+_KEEP_FOR_MODERATE_UVI = _KEEP_FOR_HIGH_UVI | {IMAGE_URLS["HIGH_UVI"]}
+
 def get_outfit_suggestion_for_forecast_weather(processed_data_for_outfit_logic: dict) -> dict:
     """
     根據未來預報的已處理和聚合的數據提供綜合穿搭建議。
@@ -110,15 +120,15 @@ def get_outfit_suggestion_for_forecast_weather(processed_data_for_outfit_logic:
         if pop >= 70:
             final_suggestions.append("• 降雨機率極高，有大雨可能，外出務必攜帶堅固雨具，建議穿著防水外套和鞋子。")
             # 如果主要溫度建議沒有賦予更優先的圖片 (如極熱/極冷)，則覆蓋為大雨圖
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"]]:
+            if image_url not in _KEEP_FOR_HEAVY_RAIN:
                 image_url = IMAGE_URLS["HEAVY_RAIN"] # 大雨圖
         elif pop >= 40:
             final_suggestions.append("• 降雨機率較高，建議隨身攜帶雨具備用，穿著易乾或防潑水材質的衣物。")
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"]]:
+            if image_url not in _KEEP_FOR_RAINY:
                 image_url = IMAGE_URLS["RAINY_FORECAST"] # 中雨圖
         elif 0 < pop < 40 and ("雨" in weather_phenomena or "雷雨" in weather_phenomena):
             final_suggestions.append("• 局部地區可能有短暫陣雨，外出建議攜帶輕便雨具。")
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]]:
+            if image_url not in _KEEP_FOR_LIGHT_RAIN_AND_WIND:
                 image_url = IMAGE_URLS["LIGHT_RAIN"] # 小雨圖
 
     # --- 溫差建議（補充）---
@@ -133,14 +143,14 @@ def get_outfit_suggestion_for_forecast_weather(processed_data_for_outfit_logic:
     if avg_humidity is not None:
         if avg_humidity >= 85: # 極高濕度
             final_suggestions.append("• 濕度極高，體感可能悶熱或濕冷，建議選擇極度透氣、吸濕排汗的輕薄衣物。")
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"], IMAGE_URLS["LIGHT_RAIN"]]:
+            if image_url not in _KEEP_FOR_HUMIDITY:
                 image_url = IMAGE_URLS["HIGH_HUMIDITY"] # 高濕度圖
         elif avg_humidity >= 70 and max_feels_like_temp is not None and max_feels_like_temp >= 25: # 較高濕度
             final_suggestions.append("• 濕度偏高且氣溫較高，體感可能較為悶熱，建議穿著寬鬆、透氣的衣物。")
         elif avg_humidity < 40: # 乾燥
             final_suggestions.append("• 空氣較為乾燥，注意肌膚保濕，可考慮攜帶護手霜或補水用品。")
             # 避免覆蓋低溫、雨天等重要圖片
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"], IMAGE_URLS["LIGHT_RAIN"]]:
+            if image_url not in _KEEP_FOR_HUMIDITY:
                 image_url = IMAGE_URLS["DRY_WEATHER"] # 乾燥天氣圖
 
     # --- 補充風速/風寒建議 (使用蒲福風級數字判斷和描述) ---
@@ -149,11 +159,11 @@ def get_outfit_suggestion_for_forecast_weather(processed_data_for_outfit_logic:
             final_suggestions.append(f"• 風力屬於 {wind_speed}，注意風寒效應，建議穿著防風外套，並固定帽子或髮型。")
             if min_feels_like_temp is not None and min_feels_like_temp < 15:
                 final_suggestions.append("• 尤其注意頭部、頸部保暖。")
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]]:
+            if image_url not in _KEEP_FOR_LIGHT_RAIN_AND_WIND:
                 image_url = IMAGE_URLS["WINDY"]
         elif wind_speed >= 5 and (min_feels_like_temp is None or min_feels_like_temp < 25): # 清風或更高，且氣溫偏涼
             final_suggestions.append(f"• 風力屬於 {wind_speed}，體感溫度可能略低，可備一件薄防風外套。")
-            if image_url not in [IMAGE_URLS["HOT"], IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]]:
+            if image_url not in _KEEP_FOR_LIGHT_RAIN_AND_WIND:
                 image_url = IMAGE_URLS["WINDY"]
         elif wind_speed >= 3 and (min_feels_like_temp is not None and min_feels_like_temp < 15): # 微風或更高，但氣溫較低
             final_suggestions.append(f"• 風力屬於 {wind_speed}，雖然風不大但天氣微涼，請注意保暖。")
@@ -163,17 +173,17 @@ def get_outfit_suggestion_for_forecast_weather(processed_data_for_outfit_logic:
         if uvi >= 11: # 危險級
             final_suggestions.append(f"• 紫外線指數高達 {uvi}！戶外活動務必全程做好防曬，包括防曬乳、帽子、太陽眼鏡、遮陽傘，建議穿著長袖、輕薄透氣的衣物。")
             # 優先使用最高等級的 UVI 圖，但如果已經是極端天氣（冷、大雨），不覆蓋
-            if image_url not in [IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]]:
+            if image_url not in _KEEP_FOR_HIGH_UVI:
                  image_url = IMAGE_URLS["HIGH_UVI"]
         if uvi >= 8: # 極量或過量
             final_suggestions.append(f"• 紫外線指數高達 {uvi}！長時間戶外活動請加強防曬，建議戴太陽眼鏡、遮陽帽，塗抹防曬乳。")
             if max_feels_like_temp is not None and max_feels_like_temp >= 25: # 在炎熱天氣下，紫外線更需要強調防曬衣物
                 final_suggestions.append("• 可考慮穿著防曬衣物。")
-            if image_url not in [IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"]]:
+            if image_url not in _KEEP_FOR_HIGH_UVI:
                 image_url = IMAGE_URLS["HIGH_UVI"]
         elif uvi >= 6: # 中量或高量
             final_suggestions.append(f"• 紫外線指數為 {uvi}，外出建議戴太陽眼鏡、遮陽帽，並塗抹防曬乳。")
-            if image_url not in [IMAGE_URLS["COLD"], IMAGE_URLS["HEAVY_RAIN"], IMAGE_URLS["RAINY_FORECAST"], IMAGE_URLS["HIGH_UVI"]]:
+            if image_url not in _KEEP_FOR_MODERATE_UVI:
                 image_url = IMAGE_URLS["HIGH_UVI"]
         elif uvi >= 3: # 中等
             final_suggestions.append(f"• 紫外線指數為 {uvi}，外出可戴太陽眼鏡。")
@@ -5,8 +5,55 @@
 `build_current_outfit_flex` 函式則用於生成即時天氣的穿搭建議卡片。
 這兩個函式都接收已經處理好的穿搭資訊和天氣數據，然後將這些數據組裝成一個視覺化且易於閱讀的 FlexBubble 物件，有效的將數據邏輯與 UI 呈現邏輯分離。
 """
-from utils.flex_message_elements import make_kv_row
-from linebot.v3.messaging.models import FlexBox, FlexText, FlexImage, FlexBubble, FlexSeparator
+from utils.flex_message_elements import make_kv_row, make_outfit_hero, SUGGESTION_TEXT_STYLE, SECTION_SEPARATOR
+from linebot.v3.messaging.models import FlexBox, FlexText, FlexBubble
+
+def _build_outfit_bubble(
+    image_url: str, title_text: str, subtitle_text: str,
+    weather_info_contents: list, suggestion_text_contents: list
+) -> FlexBubble:
+    """
+    今日與即時穿搭卡片共用的骨架。
+    兩種卡片的版面完全相同，只有圖片、標題、副標題、天氣資訊和建議文字會變動，因此只需要傳入這些變動的部分來組裝卡片。
+    """
+    return FlexBubble(
+        direction="ltr",
+        hero=make_outfit_hero(image_url),
+        body=FlexBox(
+            layout="vertical",
+            contents=[
+                FlexText(
+                    text=title_text,
+                    weight="bold",
+                    size="lg",
+                    align="center",
+                    margin="md",
+                    color="#000000"
+                ),
+                FlexText(
+                    text=subtitle_text,
+                    size="sm",
+                    color="#666666",
+                    align="center",
+                    margin="none"
+                ),
+                SECTION_SEPARATOR,
+                FlexBox(
+                    layout="vertical",
+                    spacing="sm",
+                    margin="md",
+                    contents=weather_info_contents # 這裡直接放入 FlexBox 物件列表
+                ),
+                SECTION_SEPARATOR,
+                FlexBox(
+                    layout="vertical",
+                    spacing="sm",
+                    margin="md",
+                    contents=suggestion_text_contents # 這裡直接放入 FlexText 物件列表
+                )
+            ]
+        )
+    )
 
 def build_today_outfit_flex(outfit_info: dict, location_name: str) -> FlexBubble:
     """
@@ -35,20 +82,11 @@ def build_today_outfit_flex(outfit_info: dict, location_name: str) -> FlexBubble
     """
     將穿搭建議的文字列表 `suggestion_text` 轉換為一系列的 `FlexText` 物件。
     因為 Flex Message 的內容元件需要是特定的物件（如 `FlexText`）。
-    透過迴圈，為每一條建議文字都生成一個獨立的 `FlexText` 物件，並將其加入列表，以便後續的 `FlexBox` 佈局使用。
-    """
-    suggestion_text_contents = []
-    for suggestion in suggestion_text:
-        suggestion_text_contents.append(
-            FlexText(
-                text=suggestion,
-                size="md",
-                color="#333333",
-                wrap=True, # 確保文字在超出範圍時自動換行
-                margin="sm",
-                align="start"
-            )
-        )
+    透過列表生成式，為每一條建議文字都生成一個套用共用樣式 `SUGGESTION_TEXT_STYLE` 的 `FlexText` 物件，以便後續的 `FlexBox` 佈局使用。
+    """
+    suggestion_text_contents = [
+        FlexText(text=suggestion, **SUGGESTION_TEXT_STYLE) for suggestion in suggestion_text
+    ]
 
     # --- 天氣資訊區塊內容 ---
     """
@@ -66,59 +104,14 @@ def build_today_outfit_flex(outfit_info: dict, location_name: str) -> FlexBubble
 
     # --- 組裝並回傳最終的 `FlexBubble` 物件 ---
     """
-    根據 LINE Flex Message 的 JSON 格式所建立的物件結構。
-    `FlexBubble` 作為最外層的容器，包含了 `hero`（頂部圖片）和 `body`（內容區）兩個部分。
-
-    `hero` 區塊放置代表穿搭建議的圖片。
-    `body` 區塊使用 `FlexBox` 佈局，從上到下依次放置標題、副標題、分隔線、天氣資訊區塊，以及穿搭建議文字區塊，形成一個完整且美觀的今日穿搭卡片。
+    版面結構由 `_build_outfit_bubble` 統一負責，這裡只傳入今日穿搭卡片會變動的圖片、標題、日期、天氣資訊和建議文字。
     """
-    return FlexBubble(
-        direction="ltr",
-        hero=FlexBox(
-            layout="vertical",
-            contents=[
-                FlexImage(
-                    url=suggestion_image_url, 
-                    size="full",
-                    aspectRatio="20:9",
-                    aspectMode="fit"
-                )
-            ]
-        ),
-        body=FlexBox(
-            layout="vertical",
-            contents=[
-                FlexText(
-                    text=f"☀️ {location_name} 今日穿搭建議",
-                    weight="bold",
-                    size="lg",
-                    align="center",
-                    margin="md",
-                    color="#000000"
-                ),
-                FlexText(
-                    text=date_display_string,
-                    size="sm",
-                    color="#666666",
-                    align="center",
-                    margin="none"
-                ),
-                FlexSeparator(margin="md"),
-                FlexBox(
-                    layout="vertical",
-                    spacing="sm",
-                    margin="md",
-                    contents=weather_info_contents # 這裡直接放入 FlexBox 物件列表
-                ),
-                FlexSeparator(margin="md"),
-                FlexBox(
-                    layout="vertical",
-                    spacing="sm",
-                    margin="md",
-                    contents=suggestion_text_contents # 這裡直接放入 FlexText 物件列表
-                )
-            ]
-        )
+    return _build_outfit_bubble(
+        image_url=suggestion_image_url,
+        title_text=f"☀️ {location_name} 今日穿搭建議",
+        subtitle_text=date_display_string,
+        weather_info_contents=weather_info_contents,
+        suggestion_text_contents=suggestion_text_contents
     )
 
 def build_current_outfit_flex(outfit_info: dict, location_name: str) -> FlexBubble:
@@ -148,20 +141,11 @@ def build_current_outfit_flex(outfit_info: dict, location_name: str) -> FlexBubb
     """
     將穿搭建議的文字列表 `suggestion_text` 轉換為一系列的 `FlexText` 物件。
     因為 Flex Message 的內容元件需要是特定的物件（如 `FlexText`）。
-    透過迴圈，為每一條建議文字都生成一個獨立的 `FlexText` 物件，並將其加入列表，以便後續的 `FlexBox` 佈局使用。
-    """
-    suggestion_text_contents = []
-    for suggestion in suggestion_text:
-        suggestion_text_contents.append(
-            FlexText(
-                text=suggestion,
-                size="md",
-                color="#333333",
-                wrap=True, # 確保文字在超出範圍時自動換行
-                margin="sm",
-                align="start"
-            )
-        )
+    透過列表生成式，為每一條建議文字都生成一個套用共用樣式 `SUGGESTION_TEXT_STYLE` 的 `FlexText` 物件，以便後續的 `FlexBox` 佈局使用。
+    """
+    suggestion_text_contents = [
+        FlexText(text=suggestion, **SUGGESTION_TEXT_STYLE) for suggestion in suggestion_text
+    ]
 
     # --- 天氣資訊區塊內容 ---
     """
@@ -179,57 +163,12 @@ def build_current_outfit_flex(outfit_info: dict, location_name: str) -> FlexBubb
 
     # --- 組裝並回傳最終的 `FlexBubble` 物件 ---
     """
-    根據 LINE Flex Message 的 JSON 格式所建立的物件結構。
-    `FlexBubble` 作為最外層的容器，包含了 `hero`（頂部圖片）和 `body`（內容區）兩個部分。
-
-    `hero` 區塊放置代表穿搭建議的圖片。
-    `body` 區塊使用 `FlexBox` 佈局，從上到下依次放置標題、副標題、分隔線、天氣資訊區塊，以及穿搭建議文字區塊，形成一個完整且美觀的即時穿搭卡片。
+    版面結構由 `_build_outfit_bubble` 統一負責，這裡只傳入即時穿搭卡片會變動的圖片、標題、觀測時間、天氣資訊和建議文字。
     """
-    return FlexBubble(
-        direction="ltr",
-        hero=FlexBox(
-            layout="vertical",
-            contents=[
-                FlexImage(
-                    url=suggestion_image_url, 
-                    size="full",
-                    aspectRatio="20:9",
-                    aspectMode="fit"
-                )
-            ]
-        ),
-        body=FlexBox(
-            layout="vertical",
-            contents=[
-                FlexText(
-                    text=f"⏰ {location_name} 即時穿搭建議",
-                    weight="bold",
-                    size="lg",
-                    align="center",
-                    margin="md",
-                    color="#000000"
-                ),
-                FlexText(
-                    text=date_full_formatted,
-                    size="sm",
-                    color="#666666",
-                    align="center",
-                    margin="none"
-                ),
-                FlexSeparator(margin="md"),
-                FlexBox(
-                    layout="vertical",
-                    spacing="sm",
-                    margin="md",
-                    contents=weather_info_contents # 這裡直接放入 FlexBox 物件列表
-                ),
-                FlexSeparator(margin="md"),
-                FlexBox(
-                    layout="vertical",
-                    spacing="sm",
-                    margin="md",
-                    contents=suggestion_text_contents # 這裡直接放入 FlexText 物件列表
-                )
-            ]
-        )
+    return _build_outfit_bubble(
+        image_url=suggestion_image_url,
+        title_text=f"⏰ {location_name} 即時穿搭建議",
+        subtitle_text=date_full_formatted,
+        weather_info_contents=weather_info_contents,
+        suggestion_text_contents=suggestion_text_contents
     )
\ No newline at end of file
@@ -4,11 +4,36 @@
 根據用戶指定的城市動態創建一個包含多個選項的卡片，選項包括「今日穿搭建議」、「即時穿搭建議」和「未來穿搭建議」，以及一個「查詢其他縣市」的按鈕。
 將 UI 呈現邏輯與後端處理邏輯分離，提高程式碼的可讀性和可維護性。
 """
+from functools import lru_cache
 from linebot.v3.messaging.models import (
     FlexBox, FlexText, FlexImage, FlexBubble,
     FlexButton, FlexMessage, FlexSeparator, PostbackAction
 )
 
+# --- 選單中固定不變的元件 ---
+"""
+分隔線和「查詢其他縣市」按鈕的內容與查詢的城市無關，在模組載入時建立一次，所有選單直接引用同一個物件。
+「查詢其他縣市」按鈕的樣式和行為與主要功能按鈕區隔開來，使用了不同的顏色和間距，以提供更好的視覺引導。
+發送訊息時 SDK 只會讀取這些物件來序列化，不會修改它們，因此可以安全的在多則訊息之間共用。
+"""
+_MENU_SEPARATOR = FlexSeparator(margin="lg")
+
+_OTHER_LOCATION_BUTTON = FlexButton(
+    action=PostbackAction(
+        type="postback",
+        label="查詢其他縣市",
+        data="action=outfit_other_city"
+    ),
+    style="secondary",
+    color="#AAAAAA", # 灰色，與主要按鈕區隔
+    height="sm",
+    margin="lg" # 增加上方間距，與穿搭建議按鈕區隔
+)
+
+# --- 快取已建立的選單 ---
+# 選單內容只由「查詢城市」和「預設城市顯示文字」決定，而縣市只有固定的二十幾個，同樣的組合直接重用已建立好的 FlexMessage，
+# 避免每次回覆都重新建立並驗證整棵 Flex 物件樹；發送時只會讀取（`to_dict()`）這個物件，不會修改它，因此可以安全共用
+@lru_cache(maxsize=256)
 def build_outfit_suggestions_flex(target_query_city: str, default_city_display: str) -> FlexMessage:
     """
     生成一個單一 Flex Message 卡片選單，包含今日、即時、未來穿搭建議選項。
@@ -34,24 +59,6 @@ def build_outfit_suggestions_flex(target_query_city: str, default_city_display:
             margin="md"
         )
 
-    # --- 輔助函式：用於生成「查詢其他縣市」按鈕 ---
-    def _other_location_button() -> FlexButton:
-        """
-        將這類特殊按鈕的創建邏輯分離，使樣式和行為與主要功能按鈕區隔開來。
-        這種設計讓按鈕的職責更清晰，同時使用了不同的顏色和間距，以提供更好的視覺引導。
-        """
-        return FlexButton(
-            action=PostbackAction(
-                type="postback",
-                label="查詢其他縣市",
-                data="action=outfit_other_city"
-            ),
-            style="secondary",
-            color="#AAAAAA", # 灰色，與主要按鈕區隔
-            height="sm",
-            margin="lg" # 增加上方間距，與穿搭建議按鈕區隔
-        )
-    
     # --- 組裝整個 Flex Message 結構 ---
     """
     根據 LINE Flex Message 的 JSON 格式所建立的物件結構。
@@ -100,11 +107,11 @@ def build_outfit_suggestions_flex(target_query_city: str, default_city_display:
                     align="center",
                     margin="md"
                 ),
-                FlexSeparator(margin="lg"),
+                _MENU_SEPARATOR,
                 _outfit_button("☀️ 今日穿搭建議", "today"),
                 _outfit_button("⏰ 即時穿搭建議", "current"),
                 _outfit_button("📅 未來穿搭建議 (1-7天)", "forecast"),
-                _other_location_button() # 查詢其他縣市按鈕
+                _OTHER_LOCATION_BUTTON # 查詢其他縣市按鈕
             ]
         )
     )
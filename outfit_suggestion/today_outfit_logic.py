@@ -27,6 +27,12 @@ IMAGE_URLS = {
     "COMFORTABLE"   : "https://i.postimg.cc/HLVtmjB5/COMFORTABLE.png"
 }
 
+# --- 可被紫外線圖片取代的圖片集合 ---
+# 只有在目前的圖片屬於一般溫度情境時，紫外線建議才會把圖片換成高紫外線圖片
+# 這些集合是固定的，在模組載入時建立一次即可，不需要在每次判斷中重複建立列表
+_REPLACEABLE_BY_EXTREME_UVI = frozenset({IMAGE_URLS["DEFAULT"], IMAGE_URLS["HOT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]})
+_REPLACEABLE_BY_HIGH_UVI = frozenset({IMAGE_URLS["DEFAULT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]})
+
 def get_outfit_suggestion_for_today_weather(
     location: str,
     hourly_forecast: List[Dict[str, Any]],
@@ -200,11 +206,11 @@ def get_outfit_suggestion_for_today_weather(
     elif "午後雷陣雨" in weather_phenomenon:
         suggestion_text.append("• 午後有雷陣雨，外出請攜帶雨具。")
         suggestion_image_url = IMAGE_URLS["LIGHT_RAIN"]
-    elif "陣雨" in weather_phenomenon or "雷雨" in weather_phenomenon or "雨" in weather_phenomenon:
+    elif "雨" in weather_phenomenon: # 「陣雨」、「雷雨」等描述都包含「雨」，一次子字串檢查即可涵蓋
         if precipitation_prob_raw is not None and 0 < precipitation_prob_raw <= 50:
             suggestion_text.append("• 降雨機率較高，建議攜帶雨具，穿著防潑水衣物或備薄外套。")
             suggestion_image_url = IMAGE_URLS["RAINY_CURRENT"]
-        elif precipitation_prob_raw is not None and precipitation_prob_raw == 0 and ("陣雨" in weather_phenomenon or "雨" in weather_phenomenon):
+        elif precipitation_prob_raw is not None and precipitation_prob_raw == 0:
             # 天氣描述有雨但降雨機率為 0，可能是短暫或預期有雨但尚未發生
             suggestion_text.append("• 可能有短暫降雨，建議攜帶雨具。")
             suggestion_image_url = IMAGE_URLS["RAINY_CURRENT"]
@@ -237,7 +243,7 @@ def get_outfit_suggestion_for_today_weather(
     if uv_index_raw_val is not None: # 使用原始數值進行判斷
         if uv_index_raw_val >= 11: # 危險
             suggestion_text.append(f"• 紫外線指數高達 {uv_index_formatted_str}！戶外活動務必全程做好防曬，包括防曬乳、帽子、太陽眼鏡、遮陽傘。")
-            if suggestion_image_url in [IMAGE_URLS["DEFAULT"], IMAGE_URLS["HOT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]]:
+            if suggestion_image_url in _REPLACEABLE_BY_EXTREME_UVI:
                 suggestion_image_url = IMAGE_URLS["HIGH_UVI"]
         elif uv_index_raw_val >= 8: # 過量
             suggestion_text.append(f"• 紫外線指數高達 {uv_index_formatted_str}！長時間戶外活動請加強防曬，建議戴太陽眼鏡、遮陽帽，塗抹防曬乳。")
@@ -246,7 +252,7 @@ def get_outfit_suggestion_for_today_weather(
             suggestion_image_url = IMAGE_URLS["HIGH_UVI"]
         elif uv_index_raw_val >= 6: # 高
             suggestion_text.append(f"• 紫外線指數為 {uv_index_formatted_str}，外出建議戴太陽眼鏡、遮陽帽，並塗抹防曬乳。")
-            if suggestion_image_url in [IMAGE_URLS["DEFAULT"], IMAGE_URLS["WARM"], IMAGE_URLS["COMFORTABLE"]]:
+            if suggestion_image_url in _REPLACEABLE_BY_HIGH_UVI:
                 suggestion_image_url = IMAGE_URLS["HIGH_UVI"]
         elif uv_index_raw_val >= 3: # 中
             suggestion_text.append(f"• 紫外線指數為 {uv_index_formatted_str}，外出可戴太陽眼鏡。")
@@ -8,8 +8,8 @@
 """
 import logging
 
-from utils.line_common_messaging import send_line_push_message
-from utils.firestore_manager import get_users_by_city, get_user_push_settings
+from utils.line_common_messaging import send_line_multicast_message
+from utils.firestore_manager import get_users_by_city, is_user_push_enabled
 
 # 導入今日天氣的數據聚合器
 from weather_today.today_weather_aggregator import get_today_all_weather_data
@@ -29,7 +29,7 @@ def push_daily_weather_notification(line_bot_api_instance):
     1. 從資料庫中獲取所有需要推播的用戶，並按城市分組。
     2. 遍歷每個城市，取得該城市最新的綜合天氣數據。
     3. 根據天氣數據，建立一個包含所有必要資訊的 Flex Message 訊息物件。
-    4. 針對該城市下的每一位用戶，再次檢查他們是否仍啟用推播功能；如果啟用，則將預先建立好的 Flex Message 推播給該用戶。
+    4. 針對該城市下的每一位用戶，再次檢查他們是否仍啟用推播功能；再將預先建立好的 Flex Message 一次推播給所有仍啟用的用戶。
     5. 整個過程都會有詳細的日誌記錄，以追蹤任務的執行狀況和潛在錯誤。
     """
     logger.info("開始執行每日天氣推播任務...")
@@ -66,31 +66,33 @@ def push_daily_weather_notification(line_bot_api_instance):
                 logger.error(f"無法為 {city} 產生每日天氣 Flex Message，推播跳過。")
                 continue
 
-            # 4. 為每個用戶發送推播前，再次檢查是否仍啟用推播設定並發送訊息
+            # 4. 為每個用戶發送推播前，再次檢查是否仍啟用推播設定，再一次推播給所有仍啟用的用戶
             """
             雖然 `get_users_by_city` 已經提供了已設定城市的用戶，但用戶隨時可能透過聊天指令關閉推播。
             由於 Firestore 查詢通常有延遲，如果我們依賴一個在推播任務開始時的快照，可能會錯誤的發送訊息給在快照後關閉推播的用戶。
-            透過在發送前對每個用戶進行單獨的 `get_user_push_settings` 查詢，可以確保推播決策是基於最新的用戶設定，避免不必要的訊息發送。
+            透過在發送前對每個用戶進行單獨的 `is_user_push_enabled` 查詢（同時略過已解除追蹤的用戶），可以確保推播決策是基於最新的用戶設定，避免不必要的訊息發送。
+            同一個城市的用戶收到的是同一則 Flex Message，所以先收集仍啟用推播的用戶，再用 Multicast 分批發送，而不是每個用戶各發送一次請求。
             """
+            recipients = []
             for user_id in user_ids:
                 try: # 在發送推播前，會為每個用戶單獨查詢，確認他們是否開啟了 daily_reminder_push
-                    user_settings = get_user_push_settings(user_id)
-                    if user_settings.get(FEATURE_ID):
-                        logger.info(f"正在為用戶 {user_id[:8]}... 推播 {city} 的每日天氣。")
-
-                        # 發送 Flex Message
-                        send_line_push_message(
-                            line_bot_api_instance=line_bot_api_instance,
-                            user_id=user_id,
-                            messages=[flex_message_to_send]
-                        )
-
-                        logger.info(f"成功為用戶 {user_id[:8]}... 推播 {city} 的每日天氣。")
+                    if is_user_push_enabled(user_id, FEATURE_ID): # 已解除追蹤的用戶也會被略過
+                        recipients.append(user_id)
                     else:
-                        logger.debug(f"用戶 {user_id[:8]}... 已關閉每日天氣推播，跳過。")
+                        logger.debug(f"用戶 {user_id[:8]}... 已關閉每日天氣推播或已解除追蹤，跳過。")
 
                 except Exception as e:
-                    logger.error(f"為用戶 {user_id[:8]}... 推播 {city} 的每日天氣時發生錯誤: {e}", exc_info=True)
+                    logger.error(f"查詢用戶 {user_id[:8]}... 的推播設定時發生錯誤: {e}", exc_info=True)
+
+            if recipients:
+                logger.info(f"正在為 {len(recipients)} 位用戶推播 {city} 的每日天氣。")
+
+                # 發送 Flex Message
+                send_line_multicast_message(
+                    line_bot_api_instance=line_bot_api_instance,
+                    user_ids=recipients,
+                    messages=[flex_message_to_send]
+                )
 
         # 5. 處理針對單一城市推播時發生的所有錯誤
         except Exception as e:
@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from linebot.v3.messaging.models import TextMessage
 
-from utils.line_common_messaging import send_line_push_message
+from utils.line_common_messaging import send_line_multicast_message
 from utils.firestore_manager import get_users_with_push_enabled
 
 # 導入判斷今天是否為節氣日的函式
@@ -30,7 +30,7 @@ def push_solar_terms_notification(line_bot_api_instance):
     執行流程：
     1. 判斷今天是否為節氣日；如果不是，則直接結束任務，避免不必要的資源消耗。
     2. 如果是節氣日，則從資料庫中獲取所有開啟了節氣推播功能的用戶 ID 列表。
-    3. 呼叫專門的函式，將節氣資訊轉換為一個美觀的 Flex Message 物件，然後遍歷用戶列表，將 Flex Message 推播給每個用戶。
+    3. 呼叫專門的函式，將節氣資訊轉換為一個美觀的 Flex Message 物件，然後透過 Multicast 將 Flex Message 分批推播給所有用戶。
     4. 包含一個 try-except 區塊，如果 Flex Message 推播失敗，會自動切換為發送一個簡單的文字訊息，以確保訊息傳達的可靠性。
     """
     # 1. 檢查當前日期是否為二十四節氣中的某一天
@@ -69,7 +69,7 @@ def push_solar_terms_notification(line_bot_api_instance):
     try:
         """
         首先在 `for` 迴圈外部呼叫 `get_solar_term_flex_message` 一次，生成一個完整的 Flex Message 物件。
-        在迴圈內，將這個相同的物件發送給每個用戶。
+        再透過 Multicast 將這個相同的物件分批發送給所有用戶。
         這種設計避免在每個用戶迴圈中重複生成 Flex Message，顯著提高效率，特別是用戶較多時。
         """
         flex_message_to_send = get_solar_term_flex_message(solar_term_data)
@@ -77,12 +77,11 @@ def push_solar_terms_notification(line_bot_api_instance):
             raise ValueError("無法成功建構節氣 Flex Message。")
 
         messages_to_send = [flex_message_to_send]
-        for user_id in enabled_users:
-            send_line_push_message(
-                line_bot_api_instance=line_bot_api_instance,
-                user_id=user_id,
-                messages=messages_to_send
-            )
+        send_line_multicast_message(
+            line_bot_api_instance=line_bot_api_instance,
+            user_ids=enabled_users,
+            messages=messages_to_send
+        )
         logger.info("節氣小知識推播任務執行完畢。")
 
     # 4. 錯誤處理與降級 (Fallback)
@@ -91,12 +90,11 @@ def push_solar_terms_notification(line_bot_api_instance):
         `except` 區塊中的邏輯是一個「降級」機制：為每個用戶生成一個簡單的 `TextMessage`。
         這種設計確保即使複雜的 Flex Message 渲染或推播失敗，用戶也不會收不到任何通知，仍然能以文字形式收到節氣資訊，提升系統的可靠性和用戶體驗。
         """
-        logger.error(f"處理節氣小知識推播給用戶 {user_id} 時發生錯誤: {e}", exc_info=True)
+        logger.error(f"處理節氣小知識推播時發生錯誤: {e}", exc_info=True)
 
-        for user_id in enabled_users:
-            text_message = TextMessage(text=f"【節氣小知識】\n\n今天是「{term_name}」！\n\n{solar_term_data.get('description', '無相關描述。')}\n\n希望這份小知識能為您帶來生活中的一點樂趣！")
-            send_line_push_message(
-                line_bot_api_instance=line_bot_api_instance,
-                user_id=user_id,
-                messages=[text_message]
-            )
\ No newline at end of file
+        text_message = TextMessage(text=f"【節氣小知識】\n\n今天是「{term_name}」！\n\n{solar_term_data.get('description', '無相關描述。')}\n\n希望這份小知識能為您帶來生活中的一點樂趣！")
+        send_line_multicast_message(
+            line_bot_api_instance=line_bot_api_instance,
+            user_ids=enabled_users,
+            messages=[text_message]
+        )
\ No newline at end of file
@@ -12,7 +12,7 @@
 import logging
 from linebot.v3.messaging.models import TextMessage
 
-from utils.line_common_messaging import send_line_push_message
+from utils.line_common_messaging import send_line_multicast_message
 from utils.firestore_manager import get_system_metadata, set_system_metadata, get_users_with_push_enabled
 
 # 這裡只導入 TyphoonLogic，因為它封裝了所有後續步驟
@@ -95,17 +95,16 @@ def check_and_push_typhoon_notification(line_bot_api_instance):
     # `try...except` 區塊包裹了整個推播過程
     try:
         """
-        將預先創建好的 `typhoon_flex_message` 儲存為一個列表，然後在迴圈中將這個訊息推播給每個用戶。
+        將預先創建好的 `typhoon_flex_message` 儲存為一個列表，然後透過 Multicast 將這個訊息分批推播給所有用戶。
         整個推播迴圈成功完成後，程式會呼叫 `set_system_metadata` 將當前的 `typhoon_id` 寫入資料庫。
         這種設計確保只有在確認所有推播都已發送後，才會更新狀態，這是一個標準的「提交」模式，避免在推播過程中途失敗，但狀態卻被錯誤更新的情況。
         """
         messages_to_send = [typhoon_flex_message]
-        for user_id in enabled_users:
-            send_line_push_message(
-                line_bot_api_instance=line_bot_api_instance,
-                user_id=user_id,
-                messages=messages_to_send
-            )
+        send_line_multicast_message(
+            line_bot_api_instance=line_bot_api_instance,
+            user_ids=enabled_users,
+            messages=messages_to_send
+        )
 
         # 推播完成後，更新資料庫中的上次推播 ID
         set_system_metadata(**{LAST_TYPHOON_ID_KEY: typhoon_id})
@@ -124,9 +123,8 @@ def check_and_push_typhoon_notification(line_bot_api_instance):
             text=f"【颱風警報】\n\n颱風名稱：{typhoon_name}\n\n目前無法顯示詳細資訊，請前往中央氣象署官網查看最新動態。\n\nhttps://www.cwa.gov.tw"
         )
 
-        for user_id in enabled_users:
-            send_line_push_message(
-                line_bot_api_instance=line_bot_api_instance,
-                user_id=user_id,
-                messages=[fallback_message]
-            )
\ No newline at end of file
+        send_line_multicast_message(
+            line_bot_api_instance=line_bot_api_instance,
+            user_ids=enabled_users,
+            messages=[fallback_message]
+        )
\ No newline at end of file
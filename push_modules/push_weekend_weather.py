@@ -9,8 +9,8 @@
 import logging
 from datetime import datetime
 
-from utils.line_common_messaging import send_line_push_message
-from utils.firestore_manager import get_users_by_city, get_user_push_settings
+from utils.line_common_messaging import send_line_multicast_message
+from utils.firestore_manager import get_users_by_city, is_user_push_enabled
 
 # 導入已經封裝好 Flex Message 的函式
 from weekend_weather.weekend_handler import create_weekend_weather_message
@@ -27,7 +27,7 @@ def push_weekend_weather_notification(line_bot_api_instance):
     1. 首先檢查當前日期是否為星期五，以確保任務只在正確的時機執行。
     2. 從資料庫中獲取所有需要推播的用戶，並按城市分組。
     3. 遍歷每個城市，呼叫 `create_weekend_weather_message` 函式來獲取週末天氣的訊息。
-    4. 針對該城市下的每一位用戶，再次檢查他們是否仍啟用推播功能；如果啟用，則將預先建立好的 Flex Message 推播給該用戶。
+    4. 針對該城市下的每一位用戶，再次檢查他們是否仍啟用推播功能；再將預先建立好的 Flex Message 一次推播給所有仍啟用的用戶。
     5. 整個過程都會有詳細的日誌記錄，以追蹤任務的執行狀況和潛在錯誤。
     """
     # 1. 檢查今天是否為星期五，以確保手動觸發時邏輯正確
@@ -68,27 +68,29 @@ def push_weekend_weather_notification(line_bot_api_instance):
                 """
                 這與每日天氣推播的邏輯相同，是為了確保用戶收到的推播是基於他們最新的設定。
                 雖然 `get_users_by_city` 提供了已設定城市的用戶列表，但用戶可能在推播任務開始後，隨時關閉這項功能。
-                透過在發送前進行一次即時查詢（`get_user_push_settings`），可以確保推播的準確性，避免向已關閉推播的用戶發送訊息。
+                透過在發送前進行一次即時查詢（`is_user_push_enabled`，同時略過已解除追蹤的用戶），可以確保推播的準確性，避免向已關閉推播的用戶發送訊息。
                 """
+                recipients = []
                 for user_id in user_ids:
                     try: # 在發送推播前，會為每個用戶單獨查詢，確認他們是否開啟了 weekend_weather_push
-                        user_settings = get_user_push_settings(user_id)
-                        if user_settings.get(FEATURE_ID):
-                            logger.info(f"正在為用戶 {user_id[:8]}... 推播 {city} 的週末天氣。")
-
-                            # 發送 Flex Message
-                            send_line_push_message(
-                                line_bot_api_instance=line_bot_api_instance,
-                                user_id=user_id,
-                                messages=messages_to_send
-                            )
-
-                            logger.info(f"成功為用戶 {user_id[:8]}... 推播 {city} 的週末天氣。")
+                        if is_user_push_enabled(user_id, FEATURE_ID): # 已解除追蹤的用戶也會被略過
+                            recipients.append(user_id)
                         else:
-                            logger.debug(f"用戶 {user_id[:8]}... 已關閉週末天氣推播，跳過。")
+                            logger.debug(f"用戶 {user_id[:8]}... 已關閉週末天氣推播或已解除追蹤，跳過。")
 
                     except Exception as e:
-                        logger.error(f"為用戶 {user_id[:8]}... 推播 {city} 的週末天氣時發生錯誤: {e}", exc_info=True)
+                        logger.error(f"查詢用戶 {user_id[:8]}... 的推播設定時發生錯誤: {e}", exc_info=True)
+
+                # 同一個城市的用戶收到的是同一則訊息，用 Multicast 分批發送給所有仍啟用的用戶
+                if recipients:
+                    logger.info(f"正在為 {len(recipients)} 位用戶推播 {city} 的週末天氣。")
+
+                    # 發送 Flex Message
+                    send_line_multicast_message(
+                        line_bot_api_instance=line_bot_api_instance,
+                        user_ids=recipients,
+                        messages=messages_to_send
+                    )
             else:
                 logger.warning(f"無法為城市 {city} 產生訊息，跳過推播。")
 
@@ -14,22 +14,40 @@ from pathlib import Path
 # 將 rich_menu_ids.json 的完整路徑儲存到 _JSON_PATH 這個變數裡
 _JSON_PATH = Path(__file__).parent / "rich_menu_ids.json"
 
+# 已解析的映射資料，以及解析當時檔案的修改時間（奈秒）
+# 每次切換選單都會查詢 Rich Menu ID，檔案沒有變動時直接使用記憶體中的資料，不需要重新讀取和解析 JSON
+_cached_alias_map: dict = {}
+_cached_mtime_ns: int | None = None
+
 def load_alias_map() -> dict:
     """
     載入所有 Rich Menu ID。
     從 `rich_menu_ids.json` 檔案中讀取並解析 Rich Menu 別名與 ID 的對應關係。
     整個模組的數據存取層，所有對 alias-ID 映射數據的讀取操作都應該透過這個函式進行。
     成功時返回一個包含所有映射關係的字典；若檔案不存在或解析失敗，則返回一個空字典，確保函式在任何情況下都能安全的執行。
+    返回的字典會被之後的呼叫共用，呼叫者不應修改它。
     """
-    # 檢查 JSON 檔案是否存在
-    if not _JSON_PATH.exists():
+    global _cached_alias_map, _cached_mtime_ns
+
+    # 檢查 JSON 檔案是否存在，同時取得檔案的修改時間
+    try:
+        mtime_ns = _JSON_PATH.stat().st_mtime_ns
+    except OSError:
         return {} # 返回一個空字典
+
+    # 檔案自上次解析後沒有被修改過（例如部署腳本沒有重新寫入），直接返回快取的資料
+    if mtime_ns == _cached_mtime_ns:
+        return _cached_alias_map
+
     try:
         with _JSON_PATH.open(encoding="utf-8") as fp:
-            return json.load(fp) # 返回一個包含所有映射關係的字典
+            alias_map = json.load(fp) # 包含所有映射關係的字典
     except Exception:
         return {} # 返回一個空字典
 
+    _cached_alias_map, _cached_mtime_ns = alias_map, mtime_ns
+    return alias_map
+
 def get_rich_menu_id(alias: str) -> str | None:
     """
     查詢單一 Rich Menu ID。
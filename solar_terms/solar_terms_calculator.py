@@ -11,6 +11,7 @@
 import logging
 import lunarcalendar # 直接將一個年份傳入節氣物件中，會自動計算出該年份對應的節氣日期，避免手動複雜的農曆計算
 from datetime import date, datetime
+from utils.text_processing import WEEKDAYS_CHINESE
 from .solar_terms_data import SOLAR_TERMS_INFO
 
 logger = logging.getLogger(__name__)
@@ -24,9 +25,7 @@ def format_date_with_weekday(d: date) -> str:
     Returns:
         str: 格式化後的日期字串，例如 "2025年08月14日 (四)"。
     """
-    weekdays = ["一", "二", "三", "四", "五", "六", "日"]
-    weekday_index = d.weekday() # 0 = 星期一, 6 = 星期日
-    weekday_str = weekdays[weekday_index]
+    weekday_str = WEEKDAYS_CHINESE[d.weekday()] # 0 = 星期一, 6 = 星期日
     return f"{d.year}年{d.month:02d}月{d.day:02d}日 ({weekday_str})"
 
 # --- 使用 lunarcalendar 獲取指定年份的所有 24 個節氣 ---
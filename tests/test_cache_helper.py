@@ -0,0 +1,108 @@
+# tests/test_cache_helper.py
+"""
+`utils/cache_helper.ttl_cache` 的單元測試。
+"""
+import unittest
+from unittest import mock
+
+from utils.cache_helper import ttl_cache
+
+class TtlCacheKeyTest(unittest.TestCase):
+    def test_positional_and_keyword_calls_share_one_entry(self):
+        calls = []
+
+        @ttl_cache(ttl_seconds=60)
+        def fetch(city_name: str, days: int = 3) -> dict:
+            calls.append((city_name, days))
+            return {"city": city_name, "days": days}
+
+        fetch("臺北市")
+        fetch(city_name="臺北市")
+        fetch("臺北市", 3)
+        fetch("臺北市", days=3)
+
+        self.assertEqual(calls, [("臺北市", 3)])
+
+    def test_different_arguments_use_different_entries(self):
+        calls = []
+
+        @ttl_cache(ttl_seconds=60)
+        def fetch(city_name: str) -> dict:
+            calls.append(city_name)
+            return {"city": city_name}
+
+        fetch("臺北市")
+        fetch(city_name="高雄市")
+
+        self.assertEqual(calls, ["臺北市", "高雄市"])
+
+    def test_falsy_results_are_not_cached(self):
+        calls = []
+
+        @ttl_cache(ttl_seconds=60)
+        def fetch(city_name: str) -> dict:
+            calls.append(city_name)
+            return {}
+
+        fetch("臺北市")
+        fetch(city_name="臺北市")
+
+        self.assertEqual(len(calls), 2)
+
+    def test_cacheable_predicate_skips_incomplete_results(self):
+        calls = []
+
+        @ttl_cache(ttl_seconds=60, cacheable=lambda data: bool(data) and data.get("is_complete", False))
+        def fetch(city_name: str) -> dict:
+            calls.append(city_name)
+            return {"city": city_name, "is_complete": len(calls) > 1}
+
+        first = fetch("臺北市")
+        second = fetch("臺北市")
+        third = fetch("臺北市")
+
+        self.assertFalse(first["is_complete"])
+        self.assertTrue(second["is_complete"])
+        self.assertIs(second, third)
+        self.assertEqual(len(calls), 2)
+
+class ForecastFetchCacheTest(unittest.TestCase):
+    """
+    `get_cwa_forecast_data` 使用預設的快取判斷，API 回應失敗時必須回傳空字典，才不會被快取 1 小時。
+    """
+    def setUp(self):
+        from weather_forecast import cwa_forecast_api
+        self.api = cwa_forecast_api
+        self.api.get_cwa_forecast_data.cache_clear()
+        self.addCleanup(self.api.get_cwa_forecast_data.cache_clear)
+
+    def _fetch_with_responses(self, *payloads):
+        responses = []
+        for payload in payloads:
+            response = mock.Mock(status_code=200)
+            response.json.return_value = payload
+            responses.append(response)
+        session = mock.Mock()
+        session.get.side_effect = responses
+        with mock.patch.object(self.api, "get_http_session", return_value=session):
+            results = [self.api.get_cwa_forecast_data("key", "臺北市") for _ in payloads]
+        return results, session
+
+    def test_unsuccessful_response_is_not_cached(self):
+        good = {"success": "true", "records": {"Locations": [{"Location": [{"LocationName": "臺北市"}]}]}}
+        (first, second), session = self._fetch_with_responses({"success": "false", "records": {}}, good)
+
+        self.assertEqual(first, {})
+        self.assertEqual(second, good)
+        self.assertEqual(session.get.call_count, 2)
+
+    def test_response_without_city_is_not_cached(self):
+        good = {"success": "true", "records": {"Locations": [{"Location": [{"LocationName": "臺北市"}]}]}}
+        (first, second), session = self._fetch_with_responses({"success": "true", "records": {"Locations": [{"Location": []}]}}, good)
+
+        self.assertEqual(first, {})
+        self.assertEqual(second, good)
+        self.assertEqual(session.get.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
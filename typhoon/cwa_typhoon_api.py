@@ -11,6 +11,7 @@ import logging
 import requests
 from typing import Any, Dict, Optional
 from config import CWA_TYPHOON_WARNING_API
+from utils.http_session import get_http_session
 from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
@@ -77,7 +78,7 @@ class TyphoonApiClient:
             logger.info(f"嘗試從 CWA API ({self.base_url}) 獲取颱風原始資料...")
             # 發送 HTTP GET 請求
             # `timeout=10` 設置超時時間，防止程式因網路延遲而卡住
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = get_http_session().get(self.base_url, params=params, timeout=10)
             response.raise_for_status() # 這是 `requests` 函式庫的一個功能；如果 HTTP 響應狀態碼不是 2xx，會自動拋出一個 `HTTPError`
 
             data = response.json() # 把一個 HTTP 回應（response）物件的內容，解析成 Python 的字典或列表等資料結構
@@ -138,16 +139,16 @@ class TyphoonApiClient:
                 return None
 
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP 錯誤發生: {e.response.status_code} - {e.response.text}", exc_info=True)
+            logger.error(f"HTTP 錯誤發生: {e.response.status_code} - {e.response.text}")
             return None
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"連線錯誤發生: {e}", exc_info=True)
+            logger.error(f"連線錯誤發生: {e}")
             return None
         except requests.exceptions.Timeout as e:
-            logger.error(f"請求超時 (timeout=10秒): {e}", exc_info=True)
+            logger.error(f"請求超時 (timeout=10秒): {e}")
             return None
         except requests.exceptions.RequestException as e:
-            logger.error(f"請求發生未知錯誤: {e}", exc_info=True)
+            logger.error(f"請求發生未知錯誤: {e}")
             return None
         except (KeyError, IndexError) as e:
             logger.error(f"解析 CWA API 回應時發生錯誤，可能資料結構不符: {e}", exc_info=True)
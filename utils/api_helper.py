@@ -14,6 +14,10 @@ from config import LINE_CHANNEL_ACCESS_TOKEN
 # --- 全局實例的初始化，避免重複建立 ---
 # 這些變數會在檔案被載入時只執行一次
 _conf = Configuration(access_token=LINE_CHANNEL_ACCESS_TOKEN)
+# `ApiClient` 內部的 urllib3 連線池會在所有推播和回覆之間重複使用，保持與 LINE API 的連線，不需要每次請求都重新進行 TLS 交握
+# 連線池大小預設與 CPU 數量成正比，Cloud Run 只有 1 個 vCPU 時只會保留 5 條連線；Webhook 背景執行緒和推播同時發送時會超過這個數量，因此固定設定為 16
+# 不設定自動重試，推播請求不是冪等的，重試可能讓用戶收到重複的訊息
+_conf.connection_pool_maxsize = 16
 _api_client = ApiClient(_conf)
 
 # --- MessagingApi 實例：用於傳送訊息，如 TextMessage, FlexMessage ---
@@ -0,0 +1,103 @@
+# utils/cache_helper.py
+"""
+提供有時效性（TTL）的記憶體快取裝飾器，主要用於中央氣象署 API 的請求函式。
+氣象署的資料每隔一段時間（數分鐘到數小時）才會更新一次，但每個用戶的查詢都會重新發送同樣的請求。
+將同一個城市的回應暫存一段時間，可以讓大量用戶的查詢共用同一次 API 請求的結果，減少等待時間和 API 呼叫次數。
+主要職責：
+1. 時效控制：快取的資料超過設定的秒數後自動失效，下一次呼叫會重新發送請求。
+2. 合併請求：同一個鍵同時有多個請求未命中快取時，只有第一個請求會真正呼叫 API，其他請求等待並直接使用它的結果。
+3. 只快取成功結果：API 函式失敗時回傳 None 或空字典，這些結果不會被快取，下一次呼叫會重新嘗試；也可以傳入 `cacheable` 自訂判斷條件。
+"""
+import time
+import inspect
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+def ttl_cache(ttl_seconds: float, maxsize: int = 128, cacheable: Optional[Callable[[Any], bool]] = None) -> Callable:
+    """
+    建立一個以函式參數為鍵、有時效性的快取裝飾器。
+    被裝飾的函式回傳的資料會被多個呼叫者共用，呼叫者不應修改回傳的字典。
+
+    Args:
+        ttl_seconds (float): 快取資料的有效秒數。
+        maxsize (int): 最多保留的快取筆數，超過時會先清除過期資料，仍然不夠時清除最早到期的資料。
+        cacheable (Optional[Callable[[Any], bool]]): 判斷回傳結果是否可以快取的函式；未提供時只快取非空的結果。
+            例如聚合多個 API 的函式，部分次要資料取得失敗時仍會回傳結果，但不應該讓這份不完整的資料被其他用戶共用。
+    """
+    is_cacheable = cacheable or bool
+
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {} # 鍵 → (到期時間, 資料)
+        key_locks: Dict[Tuple, threading.Lock] = {} # 每個鍵各自的鎖，用來合併同時發生的請求
+        cache_lock = threading.Lock()               # 保護 `cache` 和 `key_locks` 兩個字典本身
+        signature = inspect.signature(func)
+
+        def _make_key(args: Tuple, kwargs: Dict) -> Tuple:
+            """
+            依照函式簽名綁定參數後再組成快取鍵，讓 `f('臺北市')` 和 `f(city_name='臺北市')` 這類不同的呼叫寫法共用同一筆快取。
+            參數與函式簽名不符時不做綁定，交由原函式呼叫時拋出錯誤。
+            """
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return args + tuple(sorted(kwargs.items()))
+            bound.apply_defaults()
+            return tuple(
+                (name, tuple(sorted(value.items())) if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD else value)
+                for name, value in bound.arguments.items()
+            )
+
+        def _evict(now: float) -> None:
+            """
+            在寫入新資料前呼叫（呼叫者需持有 `cache_lock`），先清除所有過期的資料；
+            如果仍然超過上限，再清除最早到期的資料。
+            """
+            for key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                del cache[key]
+            while len(cache) >= maxsize:
+                oldest_key = min(cache, key=lambda k: cache[k][0])
+                del cache[oldest_key]
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            try:
+                hash(key)
+            except TypeError:
+                # 參數中含有無法雜湊的值（例如額外傳入的查詢參數字典），直接呼叫原函式，不使用快取
+                return func(*args, **kwargs)
+
+            # 快速路徑：快取命中且尚未過期時，不需要取得任何鎖
+            entry = cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            with cache_lock:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+
+            # 同一個鍵同一時間只允許一個執行緒呼叫原函式，其他執行緒等待後直接讀取快取
+            with key_lock:
+                entry = cache.get(key)
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+
+                result = func(*args, **kwargs)
+                if is_cacheable(result): # 失敗時的 None 或空字典（或 `cacheable` 判斷為不完整的結果）不快取
+                    now = time.monotonic()
+                    with cache_lock:
+                        _evict(now)
+                        cache[key] = (now + ttl_seconds, result)
+                return result
+
+        def cache_clear() -> None:
+            """
+            清除所有快取資料，主要用於測試或需要強制重新取得資料的情況。
+            """
+            with cache_lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
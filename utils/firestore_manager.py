@@ -206,6 +206,29 @@ def update_user_push_setting(user_id: str, feature_id: str, is_enabled: bool):
     set_user_metadata(user_id, push_settings=current_push_settings) # 寫回
     logger.info(f"用戶 {user_id} 的 {feature_id} 推播已設定為: {is_enabled}")
 
+# --- 記錄指定用戶是否仍追蹤機器人 ---
+def set_user_following(user_id: str, is_following: bool) -> None:
+    """
+    用戶解除追蹤（封鎖）機器人後，推播給他的訊息不會被送達，因此在 `meta_json` 記錄追蹤狀態，讓推播任務略過這個用戶。
+    只記錄狀態，不修改 `push_settings`，用戶解除封鎖後原本的推播設定仍然有效。
+    """
+    set_user_metadata(user_id, is_following=is_following)
+    logger.info(f"用戶 {user_id} 的追蹤狀態已設定為: {is_following}")
+
+# --- 判斷 meta_json 中記錄的用戶是否仍追蹤機器人 ---
+def _is_following(meta: Dict[str, Any]) -> bool:
+    # 舊的用戶文件沒有 `is_following` 欄位，視為仍在追蹤
+    return meta.get("is_following", True)
+
+# --- 確認指定用戶目前是否應該收到某個推播 ---
+def is_user_push_enabled(user_id: str, feature_id: str) -> bool:
+    """
+    推播任務在發送前為每個用戶即時查詢，只讀取一次用戶文件。
+    用戶必須仍在追蹤機器人，並且開啟了 `feature_id` 推播功能。
+    """
+    meta = get_user_metadata(user_id, "all_meta", {})
+    return _is_following(meta) and bool(meta.get("push_settings", {}).get(feature_id))
+
 # --- 獲取所有開啟特定推播功能的用戶 ID ---
 def get_users_with_push_enabled(feature_id: str) -> List[str]:
     """
@@ -218,6 +241,9 @@ def get_users_with_push_enabled(feature_id: str) -> List[str]:
     docs = users_ref.where(f'meta_json.push_settings.{feature_id}', '==', True).stream()
     
     for doc in docs:
+        # 已解除追蹤的用戶保留推播設定，但不會收到推播
+        if not _is_following((doc.to_dict() or {}).get('meta_json', {})):
+            continue
         enabled_users.append(doc.id)
             
     return enabled_users
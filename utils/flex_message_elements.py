@@ -5,7 +5,56 @@
 其他模組（例如即時天氣與未來預報的 Flex Message）不需要重複編寫複雜的 FlexBox 和 FlexText 結構。
 """
 from typing import Any
-from linebot.v3.messaging.models import FlexBox, FlexText
+from functools import lru_cache
+from linebot.v3.messaging.models import FlexBox, FlexText, FlexImage, FlexSeparator
+
+# --- 穿搭建議文字的共用樣式 ---
+# 今日、即時、未來預報、週末天氣與每日推播卡片的建議文字都使用相同的樣式，集中在這裡定義一次，建立 FlexText 時直接展開使用
+SUGGESTION_TEXT_STYLE = {
+    "size": "md",
+    "color": "#333333",
+    "wrap": True,  # 確保文字在超出範圍時自動換行
+    "margin": "sm",
+    "align": "start"
+}
+
+# --- 卡片區塊之間的共用分隔線 ---
+# 分隔線沒有任何動態內容，在模組載入時建立一次；即時、未來預報和週末天氣的卡片都直接引用同一個物件
+# 發送時 SDK 只會讀取這個物件來序列化，不會修改它，因此可以安全的在多則訊息之間共用
+SECTION_SEPARATOR = FlexSeparator(margin="md")
+
+@lru_cache(maxsize=128)
+def _make_kv_label(label: str) -> FlexText:
+    """
+    建立鍵值對左側的標籤文字。
+    各張卡片使用的標籤（例如「體感溫度：」）都是固定的字串，依標籤快取建立好的 FlexText，
+    所有卡片直接共用同一個物件，每一行只需要建立右側會變動的值。發送時 SDK 只會讀取這些物件，不會修改它們。
+    """
+    return FlexText(
+        text=label,
+        color="#4169E1", # 藍色
+        size="md",
+        flex=4             # 佔據較小的空間
+    )
+
+@lru_cache(maxsize=32)
+def make_outfit_hero(image_url: str) -> FlexBox:
+    """
+    建立穿搭卡片頂部的穿搭圖片區塊。
+    穿搭圖片只會是穿搭邏輯模組中 `IMAGE_URLS` 定義的十幾張固定圖片之一，
+    因此依圖片 URL 快取建立好的區塊，今日、即時、未來與週末穿搭卡片中同一張圖片直接共用，不必每次都重新建立並驗證。
+    """
+    return FlexBox(
+        layout="vertical",
+        contents=[
+            FlexImage(
+                url=image_url,
+                size="full",
+                aspectRatio="20:9",
+                aspectMode="fit"
+            )
+        ]
+    )
 
 def make_kv_row(label: str, value: Any) -> FlexBox:
     """
@@ -21,12 +70,7 @@ def make_kv_row(label: str, value: Any) -> FlexBox:
         layout="baseline", # 確保兩側文字的基線對齊，讓排版看起來更整齊
         spacing="sm",      # 設定兩個文字之間的間距為小
         contents=[
-            FlexText(
-                text=label,
-                color="#4169E1", # 藍色
-                size="md",
-                flex=4             # 佔據較小的空間
-            ),
+            _make_kv_label(label), # 固定的標籤文字，直接共用快取的物件
             FlexText(
                 text=display_value, # 使用已轉換為字串的值
                 wrap=True,          # 確保文字在超出範圍時自動換行
@@ -0,0 +1,29 @@
+# utils/http_session.py
+"""
+統一管理呼叫中央氣象署 API 時使用的 HTTP 連線。
+各個 API 模組原本直接呼叫 `requests.get`，每次請求都會建立新的連線並重新進行 TCP 與 TLS 交握。
+改為在檔案載入時建立一個共用的 `requests.Session`，讓所有請求重複使用已經建立好的連線（HTTP keep-alive）。
+主要職責：
+1. 單例模式：在檔案載入時就建立好 `Session` 實例和連線池，與 `utils/api_helper.py` 管理 LINE API 客戶端的方式相同。
+2. 連線池設定：掛載較大的 `HTTPAdapter` 連線池，讓今日天氣聚合器等同時發出多個請求的情況不會因為連線數不足而互相等待。
+3. 資源釋放：在程式結束時關閉 Session，釋放連線池中保持開啟的連線。
+"""
+import atexit
+import requests
+from requests.adapters import HTTPAdapter
+
+# --- 全局 Session 實例的初始化，避免重複建立 ---
+# 中央氣象署的所有 API 都在同一個主機下，`pool_connections` 是快取的主機數量，`pool_maxsize` 是每個主機最多保留的連線數
+# 本專案只透過這個 Session 發送 GET 請求，不修改 Session 本身的設定，因此可以安全的在多個執行緒之間共用
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+atexit.register(_http_session.close) # 工作程序結束時關閉連線池中的所有連線
+
+# --- 取得共用的 HTTP Session 實例 ---
+def get_http_session() -> requests.Session:
+    """
+    供各個中央氣象署 API 模組發送請求使用。
+    """
+    return _http_session
@@ -8,7 +8,7 @@ import json
 import logging
 from typing import List, Union
 from linebot.v3.messaging import MessagingApi
-from linebot.v3.messaging.models import Message, ReplyMessageRequest, PushMessageRequest
+from linebot.v3.messaging.models import Message, ReplyMessageRequest, PushMessageRequest, MulticastRequest
 from linebot.v3.exceptions import InvalidSignatureError
 
 from utils.flex_templates import build_hello_flex
@@ -16,6 +16,9 @@ from utils.message_builder import format_text_message
 
 logger = logging.getLogger(__name__)
 
+# LINE Multicast API 每次請求最多可以指定的收件人數量
+MULTICAST_MAX_RECIPIENTS = 500
+
 # --- 向指定用戶發送 LINE 推播訊息（主動發送）---
 def send_line_push_message(line_bot_api_instance, user_id: str, messages: List[Message]):
     """
@@ -44,6 +47,30 @@ def send_line_push_message(line_bot_api_instance, user_id: str, messages: List[M
         # 捕捉發送過程中的任何錯誤，並詳細記錄，包括堆疊追蹤資訊，以便除錯
         logger.error(f"推播訊息給 {user_id} 時發生錯誤: {e}", exc_info=True)
 
+# --- 向多位用戶發送同一則 LINE 推播訊息（主動發送）---
+def send_line_multicast_message(line_bot_api_instance, user_ids: List[str], messages: List[Message]):
+    """
+    定時推播會把同一則訊息發送給大量用戶，逐一呼叫 `push_message` 需要為每個用戶各發送一次 HTTPS 請求，SDK 也會把相同的訊息內容重新序列化一次。
+    改用 Multicast API，每 `MULTICAST_MAX_RECIPIENTS` 位用戶只需要一次請求；某一批發送失敗時只記錄錯誤，繼續發送下一批。
+    """
+    # 1. 前置檢查
+    if not messages or not user_ids:
+        logger.warning("沒有訊息或收件人可推播。")
+        return
+
+    # 2. 依照 Multicast API 的人數上限分批發送
+    for start in range(0, len(user_ids), MULTICAST_MAX_RECIPIENTS):
+        batch = user_ids[start:start + MULTICAST_MAX_RECIPIENTS]
+        try:
+            multicast_request = MulticastRequest(
+                to=batch,
+                messages=messages
+            )
+            line_bot_api_instance.multicast(multicast_request)
+            logger.info(f"訊息已成功推播給 {len(batch)} 位用戶。")
+        except Exception as e:
+            logger.error(f"推播訊息給 {len(batch)} 位用戶時發生錯誤: {e}", exc_info=True)
+
 # --- 對用戶的訊息進行回覆 ---
 def send_line_reply_message(line_bot_api_instance: MessagingApi, reply_token: str, messages: Union[Message, List[Message]], user_id: str = None):
     """
@@ -62,14 +89,17 @@ def send_line_reply_message(line_bot_api_instance: MessagingApi, reply_token: st
     )
     
     logger.debug(f"準備發送回覆。Reply Token: {reply_token}")
-    try:
-        # 在開發和測試階段輸出詳細的日誌，將訊息物件轉換為字典列表以便輸出，方便檢查即將發送的訊息內容是否正確
-        messages_as_dict = [m.to_dict() for m in messages]
-        # 將複雜的訊息物件轉換為可讀的 JSON 字串，並在發送前印出來，幫助開發者在不依賴 LINE Webhook 頁面就能確認訊息結構
-        logger.debug(f"準備發送的訊息內容: {json.dumps(messages_as_dict, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        # 如果訊息物件無法被序列化，會捕獲異常並記錄，確保日誌功能本身不會導致程式崩潰
-        logger.error(f"無法序列化訊息物件用於日誌: {e}")
+    # 只有在 DEBUG 等級啟用時才序列化訊息內容
+    # SDK 發送時本來就會再序列化一次，在正式環境中不需要為了日誌額外把整個 Flex Message 轉成 JSON
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            # 在開發和測試階段輸出詳細的日誌，將訊息物件轉換為字典列表以便輸出，方便檢查即將發送的訊息內容是否正確
+            messages_as_dict = [m.to_dict() for m in messages]
+            # 將複雜的訊息物件轉換為可讀的 JSON 字串，並在發送前印出來，幫助開發者在不依賴 LINE Webhook 頁面就能確認訊息結構
+            logger.debug(f"準備發送的訊息內容: {json.dumps(messages_as_dict, indent=2, ensure_ascii=False)}")
+        except Exception as e:
+            # 如果訊息物件無法被序列化，會捕獲異常並記錄，確保日誌功能本身不會導致程式崩潰
+            logger.error(f"無法序列化訊息物件用於日誌: {e}")
 
     # 3. 發送訊息與錯誤處理
     try:
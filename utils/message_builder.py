@@ -42,11 +42,13 @@ def format_flex_message(alt_text: str, flex_content_dict: dict) -> Union[FlexMes
         return TextMessage(text=f"抱歉，天氣卡片內容生成失敗。")
 
     # 2. 輸出日誌：用於開發與除錯
-    # 輸出原始字典，方便確認傳入的資料結構
-    logger.debug(f"即將傳送給 LINE API 的 Flex Message 內容 (原始字典): {flex_content_dict}")
+    # 只有在 DEBUG 等級啟用時才把字典轉成字串，正式環境不需要為了日誌額外序列化整個 Flex Message
+    if logger.isEnabledFor(logging.DEBUG):
+        # 輸出原始字典，方便確認傳入的資料結構
+        logger.debug(f"即將傳送給 LINE API 的 Flex Message 內容 (原始字典): {flex_content_dict}")
 
-    # 將字典轉換為 JSON 格式，可以將這段 JSON 複製到 Flex Message 模擬器中，直接預覽訊息效果
-    logger.debug(f"JSON 格式的 Flex Message 內容: {json.dumps(flex_content_dict, indent=2, ensure_ascii=False)}")
+        # 將字典轉換為 JSON 格式，可以將這段 JSON 複製到 Flex Message 模擬器中，直接預覽訊息效果
+        logger.debug(f"JSON 格式的 Flex Message 內容: {json.dumps(flex_content_dict, indent=2, ensure_ascii=False)}")
     
     # 3. 轉換與構建 FlexMessage
     try:
@@ -4,10 +4,19 @@
 確保不同寫法的相同詞彙（例如「台」和「臺」）在程式碼中被統一處理，避免因文字不匹配而導致的錯誤。
 將這些處理邏輯集中在一個模組中，可以提高程式碼的可重用性和維護性。
 """
+from functools import lru_cache
+
+# --- 星期幾的中文對照 ---
+# 以 `date.weekday()` 的回傳值（0 = 星期一，6 = 星期日）作為索引，在模組載入時建立一次
+# 各模組格式化日期時共用同一個元組，直接用整數索引取值，不需要 strftime 或字典查詢
+WEEKDAYS_CHINESE = ("一", "二", "三", "四", "五", "六", "日")
+
+@lru_cache(maxsize=64)
 def normalize_city_name(city_name: str) -> str:
     """
     將常見的縣市名稱替換為標準格式，例如把「台」改成「臺」。
     特別處理「台」與「臺」這兩種常見的寫法，將前者統一替換為後者，確保後續的資料庫查詢或邏輯判斷能夠準確匹配。
+    縣市名稱只有二十幾種，而且每個請求都會標準化一次以上，因此快取標準化的結果，同一個名稱只需要處理一次。
     """
     if not city_name: # 先檢查輸入是否為空；如果 `city_name` 是 `None` 或空字串，直接返回，避免後續操作引發錯誤
         return city_name
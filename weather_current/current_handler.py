@@ -17,6 +17,7 @@ from config import CWA_API_KEY
 from utils.firestore_manager import get_default_city # 導入用戶數據管理器 (用於獲取用戶預設城市)
 from utils.text_processing import normalize_city_name
 from utils.line_common_messaging import send_line_reply_message, send_api_error_message
+from utils.cache_helper import ttl_cache
 
 # 導入即時天氣相關功能
 from .cwa_current_api import get_cwa_current_data
@@ -26,6 +27,8 @@ from .weather_current_parser import parse_current_weather
 logger = logging.getLogger(__name__)
 
 # --- 共用函式：獲取並解析指定城市的即時天氣資料 ---
+# 測站約每 10 分鐘更新一次觀測資料，5 分鐘內同一縣市的查詢直接共用已解析好的結果，不必重新呼叫 API 和解析
+@ttl_cache(ttl_seconds=300)
 def fetch_and_parse_weather_data(city_name: str) -> dict | None:
     """
     提供一個單一的入口點，讓其他函式可以取得格式化後的天氣數據，無需關心底層的 API 呼叫細節。
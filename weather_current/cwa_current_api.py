@@ -12,6 +12,7 @@ import requests
 from config import CWA_CURRENT_WEATHER_API
 from utils.text_processing import normalize_city_name
 from utils.major_stations import COUNTY_TO_STATION_MAP, ALL_TAIWAN_COUNTIES
+from utils.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -66,14 +67,17 @@ def get_cwa_current_data(api_key: str, location_name: str) -> dict | None:
         logger.info(f"正在從中央氣象署 API ({CWA_CURRENT_WEATHER_API}) 取得 {location_name} 的即時觀測資料...")
         # 發送 HTTP GET 請求
         # `timeout=10` 設置超時時間，防止程式因網路延遲而卡住
-        response = requests.get(url, params=params, timeout=10)
+        response = get_http_session().get(url, params=params, timeout=10)
         response.raise_for_status() # 這是 `requests` 函式庫的一個功能；如果 HTTP 響應狀態碼不是 2xx，會自動拋出一個 `HTTPError`
 
-        logger.debug(f"中央氣象署 API 原始回應文字 (當 elementName 啟用時):\n{response.text}")
+        # `response.text` 會把整個回應內容解碼成字串，只有在 DEBUG 等級啟用時才讀取
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"中央氣象署 API 原始回應文字 (當 elementName 啟用時):\n{response.text}")
 
         data = response.json() # 把一個 HTTP 回應（response）物件的內容，解析成 Python 的字典或列表等資料結構
 
-        logger.debug(f"接收到的 CWA API 原始資料: {data}")
+        if logger.isEnabledFor(logging.DEBUG): # 原始資料很大，只有在 DEBUG 等級啟用時才轉成字串
+            logger.debug(f"接收到的 CWA API 原始資料: {data}")
 
         # 驗證 API 回應的成功狀態和 'records' 結構
         if data.get('success') == 'true' and data.get('records', {}).get('Station'):
@@ -88,10 +92,10 @@ def get_cwa_current_data(api_key: str, location_name: str) -> dict | None:
         logger.error(f"從中央氣象署 API 取得即時觀測資料時發生連線超時錯誤。")
         return None
     except requests.exceptions.HTTPError as e:
-        logger.error(f"從中央氣象署 API 取得即時觀測資料時發生 HTTP 錯誤: {e.response.status_code} - {e.response.text}", exc_info=True)
+        logger.error(f"從中央氣象署 API 取得即時觀測資料時發生 HTTP 錯誤: {e.response.status_code} - {e.response.text}")
         return None
     except requests.exceptions.RequestException as e:
-        logger.error(f"從中央氣象署 API 取得即時觀測資料時發生網路錯誤: {e}", exc_info=True)
+        logger.error(f"從中央氣象署 API 取得即時觀測資料時發生網路錯誤: {e}")
         return None
     except ValueError as e:
         logger.error(f"解析中央氣象署即時觀測 API 回應時發生 JSON 解析錯誤: {e}", exc_info=True)
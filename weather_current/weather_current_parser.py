@@ -9,10 +9,39 @@
 """
 import logging
 from datetime import datetime
+from functools import lru_cache
+from utils.text_processing import WEEKDAYS_CHINESE
 from utils.weather_utils import get_beaufort_scale_description, convert_ms_to_beaufort_scale
 
 logger = logging.getLogger(__name__)
 
+# --- 將觀測時間格式化為顯示用的字串 ---
+@lru_cache(maxsize=32)
+def format_observation_time(obs_time_str: str | None) -> str:
+    """
+    原始時間字串是 ISO 8601 格式，程式會轉換為 datetime 物件，然後格式化成更易於閱讀的中文日期和時間格式，例如 "日期：2025年8月20日 (三) 22:16"。
+    測站大約每 10 分鐘才更新一次觀測時間，同一段時間內查詢的用戶會拿到相同的原始字串，
+    因此以原始字串為鍵快取格式化結果，同一個觀測時間只需要解析和格式化一次。
+    """
+    if not obs_time_str or obs_time_str == '-99':
+        return "未知日期"
+
+    try:
+        # 處理 ISO 8601 格式，確保時區資訊被正確處理
+        obs_datetime_obj = datetime.fromisoformat(obs_time_str.replace('Z', '+00:00'))
+    except ValueError:
+        logger.warning(f"無法解析或格式化日期: {obs_time_str}")
+        return "未知日期" # 解析失敗，設定為 "未知日期"
+
+    chinese_weekday = WEEKDAYS_CHINESE[obs_datetime_obj.weekday()]
+
+    # 直接讀取 datetime 的屬性來組合日期和時間，不需要呼叫 strftime，也不必處理不同作業系統對 `%-m`、`%-d` 的支援差異
+    formatted_date_part = f"{obs_datetime_obj.year}年{obs_datetime_obj.month}月{obs_datetime_obj.day}日"
+    formatted_time_part = f"{obs_datetime_obj.hour:02d}:{obs_datetime_obj.minute:02d}"
+
+    # 組合成用於顯示的日期和星期幾格式
+    return f"日期：{formatted_date_part} ({chinese_weekday}) {formatted_time_part}"
+
 # --- 計算簡化版的體感溫度（熱指數) ---
 def calculate_apparent_temperature(temp_c: float, humidity_percent: float) -> float | str:
     """
@@ -112,41 +141,7 @@ def parse_current_weather(cwa_data: dict, query_location_name: str) -> dict | No
     parsed_and_formatted_info = {}
 
     # --- 觀測時間處理與格式化 ---
-    """
-    原始時間字串是 ISO 8601 格式，程式會轉換為 datetime 物件，然後格式化成更易於閱讀的中文日期和時間格式，例如 "2025年8月20日 (三) 22:16"。
-    """
-    if obs_time_str and obs_time_str != '-99':
-        try:
-            # 處理 ISO 8601 格式，確保時區資訊被正確處理
-            obs_datetime_obj = datetime.fromisoformat(obs_time_str.replace('Z', '+00:00'))
-
-            weekday_map = {
-            0: "一", 1: "二", 2: "三", 3: "四",
-            4: "五", 5: "六", 6: "日"
-            }
-
-            chinese_weekday = weekday_map.get(obs_datetime_obj.weekday(), "")
-
-            # 格式化日期字串 (兼容不同系統的 strftime 格式)
-            try:
-                # 嘗試使用 %-m 和 %-d (Linux/macOS 兼容)
-                formatted_date_part = obs_datetime_obj.strftime("%Y年%-m月%-d日") 
-            except ValueError:
-                # 如果失敗 (如在 Windows 上)，使用 %m 和 %d
-                formatted_date_part = obs_datetime_obj.strftime("%Y年%m月%d日")
-
-            # 格式化時間部分
-            formatted_time_part = obs_datetime_obj.strftime('%H:%M')
-
-            # 組合成用於顯示的日期和星期幾格式
-            parsed_and_formatted_info['observation_time'] = \
-                f"日期：{formatted_date_part} ({chinese_weekday}) {formatted_time_part}"
-
-        except ValueError:
-            logger.warning(f"無法解析或格式化日期: {obs_time_str}")
-            parsed_and_formatted_info['observation_time'] = "未知日期" # 解析失敗，設定為 "未知日期"
-    else:
-        parsed_and_formatted_info['observation_time'] = "未知日期"
+    parsed_and_formatted_info['observation_time'] = format_observation_time(obs_time_str)
 
     # --- 提取、計算並最終格式化其他天氣元素 ---
     # 天氣描述 (Weather)
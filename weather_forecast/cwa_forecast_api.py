@@ -7,14 +7,18 @@
 import logging
 import requests
 from config import CWA_FORECAST_1WEEK_API
+from utils.cache_helper import ttl_cache
+from utils.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
+# 一週預報每 6 小時才更新一次，1 小時內同一縣市的查詢直接共用同一次 API 回應
+@ttl_cache(ttl_seconds=3600)
 def get_cwa_forecast_data(api_key: str, location_name: str) -> dict:
     """
     從中央氣象署 API 取得臺灣各縣市未來一週天氣預報資料 (F-D0047-091)。
     這個函式會發送 HTTP GET 請求到指定的 API 端點，並帶上授權碼、查詢地點等參數。
-    處理可能發生的網路錯誤或 JSON 解析錯誤，成功時回傳原始的 JSON 數據字典，失敗則回傳空字典。
+    處理可能發生的網路錯誤或 JSON 解析錯誤，成功時回傳原始的 JSON 數據字典；失敗、`success` 不是 "true" 或缺少該縣市資料時回傳空字典（不會被快取）。
     """
     # --- 設置 API URL ---
     url = CWA_FORECAST_1WEEK_API
@@ -30,15 +34,29 @@ def get_cwa_forecast_data(api_key: str, location_name: str) -> dict:
     # --- 發送請求與錯誤處理 ---
     try:
         logger.info(f"正在從中央氣象署 API 取得 {location_name} 的天氣預報資料...")
-        # 使用 `requests` 函式庫發送 HTTP GET 請求
-        response = requests.get(url, params=params)
+        # 使用共用的 `requests.Session` 發送 HTTP GET 請求，重複使用已建立的連線
+        response = get_http_session().get(url, params=params, timeout=10)
         # 打印 HTTP 狀態碼
         logger.debug(f"CWA API response status code: {response.status_code}")
         # 打印原始響應文本
-        logger.debug(f"CWA API raw response text: {response.text}")
+        # `response.text` 會把整個回應內容解碼成字串，只有在 DEBUG 等級啟用時才讀取
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"CWA API raw response text: {response.text}")
         
         response.raise_for_status() # 這是 `requests` 函式庫的一個功能；如果 HTTP 響應狀態碼不是 2xx，會自動拋出一個 `HTTPError`
         data = response.json() # 把一個 HTTP 回應（response）物件的內容，解析成 Python 的字典或列表等資料結構
+
+        # 與其他中央氣象署 API 模組相同，確認回應成功並包含查詢的縣市，否則回傳空字典
+        # 失敗的回應不會被 `ttl_cache` 快取，下一次查詢會重新發送請求，而不是讓同一個縣市的預報在 1 小時內都無法使用
+        if data.get("success") != "true":
+            logger.warning(f"CWA API 回應 'success' 為 False，未能成功取得 {location_name} 的預報資料。回應內容: {data.get('message', '無訊息')}")
+            return {}
+
+        locations = data.get("records", {}).get("Locations", [])
+        if not locations or not locations[0].get("Location"):
+            logger.warning(f"CWA API 回應中沒有 {location_name} 的預報資料。")
+            return {}
+
         logger.info(f"成功取得 {location_name} 的天氣預報資料。")
         return data
     except requests.exceptions.RequestException as e:
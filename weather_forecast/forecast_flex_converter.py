@@ -10,7 +10,7 @@
 """
 import logging
 from collections import Counter
-from typing import Any, List, Dict
+from typing import Any, Dict, Iterator, List
 from linebot.v3.messaging.models import FlexMessage, FlexBubble, FlexCarousel
 
 from utils.weather_utils import get_beaufort_scale_description, convert_ms_to_beaufort_scale
@@ -41,20 +41,20 @@ def safe_int(val: Any) -> int | None:
         return None
 
 # --- 聚合解析後的未來天氣預報數據 ---
-def _aggregate_parsed_forecast_data(parsed_data: Dict) -> List[Dict]:
+def _aggregate_parsed_forecast_data(parsed_data: Dict) -> Iterator[Dict]:
     """
     這個函式只負責數據的提取、處理和彙整，不生成 FlexBubble，也不處理日期格式化（由 weather_forecast_parser.py 完成）。
     其結果會被 convert_forecast_to_bubbles 和 get_weekend_forecast_flex_messages 使用。
+    以產生器的方式逐日產出聚合結果，呼叫端取得足夠的天數（例如只要 3 天，或找到週末兩天）後就停止迭代，後面的日期不會被聚合。
 
     Args:
         parsed_data (Dict): 來自 weather_forecast_parser.parse_forecast_weather() 的輸出。
 
-    Returns:
-        List[Dict]: 包含每日聚合天氣數據的列表。
+    Yields:
+        Dict: 每一天的聚合天氣數據。
     """
-    logger.debug(f"開始聚合原始預報數據。第一筆資料: {parsed_data.get('forecast_periods', [])[0] if parsed_data.get('forecast_periods') else '無資料'}")
-
-    final_days_aggregated: List[Dict] = []
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"開始聚合原始預報數據。第一筆資料: {parsed_data.get('forecast_periods', [])[0] if parsed_data.get('forecast_periods') else '無資料'}")
 
     # 數據處理
     """
@@ -223,13 +223,12 @@ def _aggregate_parsed_forecast_data(parsed_data: Dict) -> List[Dict]:
             "date_formatted": p.get("date_str") # ***週末天氣的日期一直沒有數據，是因為沒有增加這行
         }
         
-        final_days_aggregated.append(final_day_data)
-
-    logger.debug(f"✅ 每日預報數據已彙整完畢。總計 {len(final_days_aggregated)} 天數據。")
-    return final_days_aggregated
+        yield final_day_data
 
 # --- 將解析後的未來天氣預報數據轉換為 LINE Flex Message 的氣泡列表 ---
-def convert_forecast_to_bubbles(parsed_data: Dict, days: int, include_outfit_suggestions: bool = False) -> tuple[List[FlexBubble], List[FlexBubble]]:
+def convert_forecast_to_bubbles(
+    parsed_data: Dict, days: int, include_outfit_suggestions: bool = False, include_weather_bubbles: bool = True
+) -> tuple[List[FlexBubble], List[FlexBubble]]:
     """
     此函式負責數據的聚合、格式化和協調穿搭建議的生成。
 
@@ -237,6 +236,7 @@ def convert_forecast_to_bubbles(parsed_data: Dict, days: int, include_outfit_sug
         parsed_data (Dict): 來自 weather_forecast_parser.parse_forecast_weather() 的輸出。
         days (int): 需要生成預報的日數 (例如 3, 5, 7)。
         include_outfit_suggestions (bool): 是否包含穿搭建議卡片。
+        include_weather_bubbles (bool): 是否生成天氣預報卡片。只需要穿搭建議卡片的呼叫端（例如未來穿搭建議）可以設為 False，省去建立用不到的卡片。
 
     Returns:
         tuple[List[FlexBubble], List[FlexBubble]]: 
@@ -246,7 +246,7 @@ def convert_forecast_to_bubbles(parsed_data: Dict, days: int, include_outfit_sug
     """
     logger.debug(f"呼叫 convert_forecast_to_bubbles。")
 
-    # 使用內部輔助函式獲取聚合後的數據
+    # 使用內部輔助函式逐日獲取聚合後的數據，迴圈在達到 `days` 天後停止，其餘日期不會被聚合
     all_aggregated_data = _aggregate_parsed_forecast_data(parsed_data)
 
     general_weather_bubbles: List[FlexBubble] = []
@@ -266,39 +266,32 @@ def convert_forecast_to_bubbles(parsed_data: Dict, days: int, include_outfit_sug
         day_data_for_bubble['loc_name'] = loc_name # 確保 loc_name 傳遞給 Flex 模板
         day_data_for_bubble['day_index'] = i + 1   # 新增第幾天
 
-        data_for_flex = day_data_for_bubble.copy() # 建立一個副本，避免影響原始數據
-
         # 將 processed_data_for_outfit_logic 中的 set 轉換為 list
         # 由於 JSON 序列化無法處理 set，因此在傳遞給可能進行 json.dumps 的函式之前需要轉換
-        if "raw_period_data_for_outfit" in data_for_flex:
-            if "weather_phenomena" in data_for_flex["raw_period_data_for_outfit"] and \
-            isinstance(data_for_flex["raw_period_data_for_outfit"]["weather_phenomena"], set):
-                data_for_flex["raw_period_data_for_outfit"]["weather_phenomena"] = \
-                    list(data_for_flex["raw_period_data_for_outfit"]["weather_phenomena"])
+        # 每一天的聚合數據都是產生器新建立的字典，直接在上面轉換即可，不需要先複製一份
+        raw_period_data = day_data_for_bubble.get("raw_period_data_for_outfit")
+        if raw_period_data and isinstance(raw_period_data.get("weather_phenomena"), set):
+            raw_period_data["weather_phenomena"] = list(raw_period_data["weather_phenomena"])
 
-        general_weather_bubbles.append(build_observe_weather_flex(day_data_for_bubble, days))
+        if include_weather_bubbles:
+            general_weather_bubbles.append(build_observe_weather_flex(day_data_for_bubble, days))
 
         # 如果需要包含穿搭建議，則生成穿搭建議數據
         if include_outfit_suggestions:
             # 將處理過的數值數據傳遞給穿搭建議邏輯
             outfit_suggestion = get_outfit_suggestion_for_forecast_weather(day_data_for_bubble["raw_period_data_for_outfit"])
             
-            # 將格式化後的天氣數據和穿搭建議合併，形成一個完整的字典
-            outfit_info_for_card = {
-                **day_data_for_bubble, # 包含所有 display_xxx 鍵
-                **outfit_suggestion    # 包含 outfit_description, outfit_image_url
-            }
-
-            # 同樣在 build_forecast_outfit_card 中進行 JSON 序列化之前，也需要將 set 轉換為 list
-            # 這裡也建立一個副本並轉換，以防 build_forecast_outfit_card 內部也有 json.dumps
-            outfit_data_for_card_flex = outfit_info_for_card.copy()
-            if "raw_period_data_for_outfit" in outfit_data_for_card_flex and \
-                "weather_phenomena" in outfit_data_for_card_flex["raw_period_data_for_outfit"] and \
-                isinstance(outfit_data_for_card_flex["raw_period_data_for_outfit"]["weather_phenomena"], set):
-                    outfit_data_for_card_flex["raw_period_data_for_outfit"]["weather_phenomena"] = \
-                        list(outfit_data_for_card_flex["raw_period_data_for_outfit"]["weather_phenomena"])
-
-            outfit_bubble_obj = build_forecast_outfit_card(outfit_info_for_card, loc_name, i) # 這裡傳入 i 作為 day_offset
+            # 在這裡統一把建議文字整理成列表，`build_forecast_outfit_card` 就不需要再為每張卡片做型別檢查
+            suggestion_text = outfit_suggestion.get("suggestion_text")
+            if not isinstance(suggestion_text, list):
+                outfit_suggestion["suggestion_text"] = [str(suggestion_text)] if suggestion_text is not None else ["目前無法提供未來穿搭建議。"]
+
+            # 將穿搭建議併入格式化後的天氣數據，形成一個完整的字典
+            # `day_data_for_bubble` 是產生器為這一天新建立的字典，天氣預報卡片也已經建立完成，直接併入即可，不需要再複製出一份合併後的字典
+            # 上方已經把 `weather_phenomena` 的 set 轉成 list，這裡不需要再轉換一次
+            day_data_for_bubble.update(outfit_suggestion) # 加入 suggestion_text, suggestion_image_url
+
+            outfit_bubble_obj = build_forecast_outfit_card(day_data_for_bubble, loc_name, i) # 這裡傳入 i 作為 day_offset
             outfit_suggestion_bubbles.append(outfit_bubble_obj)
 
     logger.debug(f"✅ 每日天氣資料已整理完畢。共生成 {len(general_weather_bubbles)} 個天氣預報卡片。")
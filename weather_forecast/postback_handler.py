@@ -16,6 +16,7 @@ from linebot.v3.webhooks.models import PostbackEvent
 
 from config import CWA_API_KEY
 
+from utils.cache_helper import ttl_cache
 from utils.firestore_manager import set_user_state # 導入用戶狀態管理器
 from utils.line_common_messaging import (          # 導入通用訊息發送功能
     send_line_reply_message, send_api_error_message
@@ -29,6 +30,8 @@ from .line_forecast_messaging import build_forecast_weather_flex
 logger = logging.getLogger(__name__)
 
 # --- 共用函式：獲取並解析指定城市的天氣預報資料 ---
+# 與 `get_cwa_forecast_data` 使用相同的有效時間，同一份原始預報只需要解析一次
+@ttl_cache(ttl_seconds=3600)
 def fetch_and_parse_forecast_data(city_name: str) -> dict | None:
     """
     將獲取中央氣象署 API 資料、解析數據的步驟封裝在一起，方便在不同地方重複使用。
@@ -42,7 +45,9 @@ def fetch_and_parse_forecast_data(city_name: str) -> dict | None:
             logger.warning(f"[ForecastPostbackHandler] get_cwa_forecast_data 未返回任何資料，城市: {city_name}")
             return None
         
-        logger.debug(f"[ForecastPostbackHandler] 接收到的 CWA API 原始資料: {json.dumps(weather_data, indent=2, ensure_ascii=False)[:2000]}...")
+        # 原始資料和解析結果都很大，只有在 DEBUG 等級啟用時才序列化，避免正式環境中每次請求都白白轉換一次
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[ForecastPostbackHandler] 接收到的 CWA API 原始資料: {json.dumps(weather_data, indent=2, ensure_ascii=False)[:2000]}...")
 
         # 2. 解析並格式化天氣數據 (得到可直接用於 Flex Message 模板的字典)
         parsed_weather = parse_forecast_weather(weather_data, city_name)
@@ -50,7 +55,8 @@ def fetch_and_parse_forecast_data(city_name: str) -> dict | None:
             logger.error(f"[ForecastPostbackHandler] 無法從取得的預報資料中解析出 {city_name} 的天氣資訊，或解析結果不完整。")
             return None
         
-        logger.debug(f"[ForecastPostbackHandler] 成功解析天氣數據: {parsed_weather}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[ForecastPostbackHandler] 成功解析天氣數據: {parsed_weather}")
         return parsed_weather
     
     except Exception as e:
@@ -10,6 +10,7 @@
 import json
 import logging
 import datetime
+from utils.text_processing import WEEKDAYS_CHINESE
 
 logger = logging.getLogger(__name__)
 
@@ -82,7 +83,8 @@ def parse_forecast_weather(cwa_raw_data: dict, city_name: str) -> dict:
         logger.error(f"cwa_raw_data 不是有效的字典類型: {type(cwa_raw_data)}")
         return {"location_name": city_name, "forecast_periods": []}
 
-    logger.debug(f"實際取得的 CWA JSON 結構: {json.dumps(cwa_raw_data, indent=2, ensure_ascii=False)[:2000]}...")
+    if logger.isEnabledFor(logging.DEBUG): # 原始資料很大，只有在 DEBUG 等級啟用時才序列化
+        logger.debug(f"實際取得的 CWA JSON 結構: {json.dumps(cwa_raw_data, indent=2, ensure_ascii=False)[:2000]}...")
     
     parsed_weather = {}
 
@@ -125,7 +127,8 @@ def parse_forecast_weather(cwa_raw_data: dict, city_name: str) -> dict:
     
     logger.info(f"✅ 成功找到縣市 {city_name} 的資料")
     logger.info(f"共取得 {len(target_location['WeatherElement'])} 個氣象元素")
-    logger.debug(f"📦 target_location 內容: {json.dumps(target_location, ensure_ascii=False, indent=2)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"📦 target_location 內容: {json.dumps(target_location, ensure_ascii=False, indent=2)}")
 
     # 列出找到的天氣元素，以及每個元素有多少個時間段的預報數據，方便 debug
     for el in target_location["WeatherElement"]:
@@ -134,6 +137,9 @@ def parse_forecast_weather(cwa_raw_data: dict, city_name: str) -> dict:
     # 聚合時間段資料
     daily_aggregated = {}
 
+    # 逐筆時間段的除錯訊息在內層迴圈中會被執行上百次，先判斷一次 DEBUG 等級是否啟用，未啟用時完全不組合這些字串
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
     # 遍歷從氣象署 API 獲取的所有天氣元素
     for element in target_location.get("WeatherElement", []):
         element_name = element.get("ElementName")
@@ -208,8 +214,9 @@ def parse_forecast_weather(cwa_raw_data: dict, city_name: str) -> dict:
             # 使用 `safe_val` 函式處理缺失數據
             val = safe_val(value_dict.get(inner_field))
 
-            logger.debug(f"📅 處理元素: {element_name} / Start: {start_time} / End: {end_time} / Period: {period} / date_key: {date_key} / inner_field: {inner_field}")
-            logger.debug(f"ElementValue: {value_dict} / 取值結果: {val}")
+            if debug_enabled:
+                logger.debug(f"📅 處理元素: {element_name} / Start: {start_time} / End: {end_time} / Period: {period} / date_key: {date_key} / inner_field: {inner_field}")
+                logger.debug(f"ElementValue: {value_dict} / 取值結果: {val}")
 
             # 將數值存入正確的 key 中
             daily_aggregated[date_key][f"{target_key}_{period}"] = val
@@ -236,20 +243,12 @@ def parse_forecast_weather(cwa_raw_data: dict, city_name: str) -> dict:
         daily = daily_aggregated[date_key]
 
         if daily["date_obj"]:
-            weekday_map_chinese = {
-                0: "一", 1: "二", 2: "三", 3: "四", 4: "五", 5: "六", 6: "日"
-            }
-            chinese_weekday = weekday_map_chinese.get(daily["date_obj"].weekday(), "")
+            date_obj = daily["date_obj"]
+            chinese_weekday = WEEKDAYS_CHINESE[date_obj.weekday()]
 
             # 格式化完整日期字串
-            # 使用 try-except 區塊處理不同作業系統下 strftime 格式字串的差異
-            # 確保程式碼在 Windows 和 Linux/MacOS 上都能正常運作
-            try:
-                # 如果使用 Linux / MacOS
-                daily["date_str"] = "日期：" + daily["date_obj"].strftime("%Y年%-m月%-d日") + f" ({chinese_weekday})"
-            except ValueError:
-                # 如果使用 Windows
-                daily["date_str"] = "日期：" + daily["date_obj"].strftime("%Y年%m月%d日") + f" ({chinese_weekday})"
+            # 直接讀取日期物件的屬性來組合，不需要呼叫 strftime，也不必處理不同作業系統對 `%-m`、`%-d` 的支援差異
+            daily["date_str"] = f"日期：{date_obj.year}年{date_obj.month}月{date_obj.day}日 ({chinese_weekday})"
 
         forecast_periods.append(daily)
         
@@ -261,15 +260,16 @@ def parse_forecast_weather(cwa_raw_data: dict, city_name: str) -> dict:
     # 記錄並回傳結果
     """
     在返回結果之前，將解析後的數據轉換為 JSON 字串並記錄下來，用於偵錯。
-    由於 `datetime.date` 物件不能直接被 `json.dumps` 序列化，這裡使用 `default=str` 參數來將它轉換為字串。
+    由於 `datetime.date` 物件不能直接被 `json.dumps` 序列化，這裡使用 `default=str` 參數來將它轉換為字串，一次序列化就能完成。
+    只有在 DEBUG 等級啟用時才進行序列化，正式環境不需要為了日誌額外處理整份預報資料。
     確保日誌輸出的完整性和可讀性，同時也對可能發生的序列化錯誤進行處理，避免因為日誌記錄失敗而影響主程式的運作。
     """
-    try:
-        parsed_weather_for_log = json.loads(json.dumps(parsed_weather, default=str))
-        logger.debug(f"✅ 預報解析結果: {json.dumps(parsed_weather_for_log, ensure_ascii=False, indent=2)}")
-    except Exception as e:
-        logger.error(f"解析結果序列化到日誌時出錯: {e}")
-        logger.debug(f"✅ 預報解析結果 (簡化): 總數 {len(forecast_periods)} 個時段。")
+    if logger.isEnabledFor(logging.DEBUG):
+        try:
+            logger.debug(f"✅ 預報解析結果: {json.dumps(parsed_weather, default=str, ensure_ascii=False, indent=2)}")
+        except Exception as e:
+            logger.error(f"解析結果序列化到日誌時出錯: {e}")
+            logger.debug(f"✅ 預報解析結果 (簡化): 總數 {len(forecast_periods)} 個時段。")
     
     logger.info(f"解析完成: {city_name} 共 {len(forecast_periods)} 個時段天氣資料。")
     return parsed_weather
\ No newline at end of file
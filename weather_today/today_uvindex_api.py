@@ -10,9 +10,13 @@
 import logging
 import requests
 from config import CWA_TODAY_UVINDEX_API
+from utils.cache_helper import ttl_cache
+from utils.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
+# 紫外線指數每小時才更新一次，而且一次回傳全台所有測站的資料，15 分鐘內所有縣市的查詢都共用同一次 API 回應
+@ttl_cache(ttl_seconds=900)
 def get_today_uvindex_data(api_key: str, params: dict = None) -> dict | None:
     """
     執行對中央氣象署紫外線指數 API 的通用請求。
@@ -37,7 +41,7 @@ def get_today_uvindex_data(api_key: str, params: dict = None) -> dict | None:
         logger.info(f"正在向 CWA API 請求資料: {url} (Dataset ID: {url})")
         # 發送 HTTP GET 請求
         # `timeout=10` 設置超時時間，防止程式因網路延遲而卡住
-        response = requests.get(url, params=default_params, timeout=10)
+        response = get_http_session().get(url, params=default_params, timeout=10)
         response.raise_for_status()  # 這是 `requests` 函式庫的一個功能；如果 HTTP 響應狀態碼不是 2xx，會自動拋出一個 `HTTPError`
         
         data = response.json() # 把一個 HTTP 回應（response）物件的內容，解析成 Python 的字典或列表等資料結構
@@ -55,10 +59,10 @@ def get_today_uvindex_data(api_key: str, params: dict = None) -> dict | None:
         logger.error(f"請求 CWA API 時發生連線超時錯誤 (Dataset ID: {url})。")
         return None
     except requests.exceptions.HTTPError as e:
-        logger.error(f"請求 CWA API 時發生 HTTP 錯誤: {e.response.status_code} - {e.response.text}", exc_info=True)
+        logger.error(f"請求 CWA API 時發生 HTTP 錯誤: {e.response.status_code} - {e.response.text}")
         return None
     except requests.exceptions.RequestException as e:
-        logger.error(f"請求 CWA API 時發生網路錯誤 (Dataset ID: {url}): {e}", exc_info=True)
+        logger.error(f"請求 CWA API 時發生網路錯誤 (Dataset ID: {url}): {e}")
         return None
     except ValueError as e:
         logger.error(f"解析 CWA API 回應時發生 JSON 解析錯誤 (Dataset ID: {url}): {e}", exc_info=True)
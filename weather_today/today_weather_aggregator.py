@@ -3,15 +3,18 @@
 「今日天氣」功能的數據聚合器。
 將來自中央氣象署不同 API 的多種數據源整合在一起。
 主要職責：
-1. 協調 API 請求：依序呼叫多個不同的 API 模組（36小時預報、未來 3 天預報、紫外線指數），獲取原始數據。
+1. 協調 API 請求：同時向多個不同的 API 模組（36小時預報、未來 3 天預報、紫外線指數）發出請求，獲取原始數據。
 2. 處理數據解析：將獲取到的原始數據傳遞給對應的解析器，轉換為結構化、易於使用的格式。
 3. 整合數據：將所有解析後的數據合併到一個單一的字典中。
 4. 錯誤處理：如果任何一個數據獲取或解析環節失敗，會記錄錯誤並返回 None，確保上層呼叫者能夠安全的處理失敗情況。
 """ 
 import logging
 from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 
-from config import CWA_API_KEY
+from config import CWA_API_KEY, GUNICORN_THREADS, WEBHOOK_WORKER_THREADS
+
+from utils.cache_helper import ttl_cache
 
 from .cwa_today_api import get_cwa_today_data
 from .weather_today_parser import parse_today_weather
@@ -26,13 +29,37 @@ from .uv_station_mapping import get_uv_station_id # 導入紫外線測站映射
 
 logger = logging.getLogger(__name__)
 
+# --- 平行發送 CWA API 請求的執行緒池 ---
+"""
+三個 API 請求彼此獨立，而且時間幾乎都花在等待網路回應上。
+依序呼叫時，總等待時間是三次請求的總和；同時發出後，總等待時間只取決於最慢的那一次請求。
+執行緒池在模組載入時建立一次，讓每次查詢都重複使用同一組執行緒。
+同一個工作程序中，gunicorn 的請求執行緒和 Webhook 背景執行緒都可能同時查詢不同縣市，每次查詢會送出 3 個請求。
+`future.result(timeout=...)` 的等待時間也包含請求在佇列中排隊的時間，執行緒不足時，即使 API 能正常回應，查詢也可能因為排隊而逾時。
+因此執行緒池的大小以「所有可能同時查詢的執行緒 × 3」計算，確保每個請求送出後都能立即執行；執行緒只有在需要時才會建立。
+"""
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=3 * (GUNICORN_THREADS + WEBHOOK_WORKER_THREADS), thread_name_prefix="cwa_today_fetch")
+
+# 等待單一請求結果的上限秒數，略大於各 API 模組中 `requests.get` 的 10 秒逾時設定
+_FETCH_RESULT_TIMEOUT = 15
+
+def _is_complete(all_weather_data: Optional[Dict]) -> bool:
+    """
+    只有所有資料都成功取得的結果才可以被快取。
+    未來 3 天預報或紫外線指數取得失敗時，聚合器仍會回傳主要的 36 小時預報給目前的用戶，
+    但這份不完整的結果不應該在接下來的 10 分鐘內被同一縣市的所有用戶共用，下一次查詢會重新嘗試。
+    """
+    return bool(all_weather_data) and all_weather_data.get("is_complete", False)
+
+# 與 `get_cwa_today_data`、`get_cwa_3days_data` 使用相同的有效時間，同一縣市在 10 分鐘內只需要聚合和解析一次
+@ttl_cache(ttl_seconds=600, cacheable=_is_complete)
 def get_today_all_weather_data(city_name: str) -> Optional[Dict]:
     """
     獲取指定城市的所有今日天氣數據：
     - 36 小時天氣預報 (F-C0032-001)
     - 未來 3 天天氣預報 (F-D0047-089)
     - 每日紫外線指數 (O-A0005-001)
-    所有數據流的匯集點，依序呼叫各個 API 和解析器，將結果整合在一個字典中。
+    所有數據流的匯集點，先同時發出三個 API 請求，再依序呼叫各個解析器，將結果整合在一個字典中。
 
     Args:
         city_name (str): 查詢的城市名稱。
@@ -46,17 +73,25 @@ def get_today_all_weather_data(city_name: str) -> Optional[Dict]:
         "locationName"     : city_name,
         "general_forecast" : None,
         "hourly_forecast"  : [],
-        "uv_data"          : None
+        "uv_data"          : None,
+        "is_complete"      : True # 次要資料（未來 3 天預報、紫外線指數）取得失敗時設為 False，結果不會被快取
     }
 
+    # 同時發出三個 API 請求，後續各區塊再分別等待並解析自己的結果
+    # 紫外線指數 API 一次回傳全台所有測站的資料，不需要傳入城市；但如果該城市沒有對應的紫外線測站，就不必發出這個請求
+    station_id = get_uv_station_id(city_name)
+    forecast_future = _FETCH_EXECUTOR.submit(get_cwa_today_data, CWA_API_KEY, city_name)
+    hourly_future = _FETCH_EXECUTOR.submit(get_cwa_3days_data, CWA_API_KEY, city_name)
+    uv_future = _FETCH_EXECUTOR.submit(get_today_uvindex_data, CWA_API_KEY) if station_id else None
+
     # 1. 取得 36 小時天氣預報 (F-C0032-001)
     try:
         """
         獲取並解析 36 小時預報數據。
-        如果 `get_cwa_today_data` 或 `parse_today_weather` 失敗，程式會記錄錯誤並立即返回 `None`。
+        如果 `get_cwa_today_data` 或 `parse_today_weather` 失敗（包含等待逾時），程式會記錄錯誤並立即返回 `None`。
         防止在缺少最關鍵數據的情況下繼續執行，避免產生無效的結果。
         """
-        raw_forecast_data = get_cwa_today_data(CWA_API_KEY, city_name)
+        raw_forecast_data = forecast_future.result(timeout=_FETCH_RESULT_TIMEOUT)
         if not raw_forecast_data:
             logger.error(f"無法取得 {city_name} 的 36 小時天氣預報。")
             return None
@@ -81,33 +116,42 @@ def get_today_all_weather_data(city_name: str) -> Optional[Dict]:
         會記錄 `warning` 日誌，並將 `hourly_forecast` 設置為空列表 `[]`，然後繼續執行。
         確保主要功能（顯示 36 小時預報）在次要數據獲取失敗時仍然可用。
         """
-        raw_hourly_data = get_cwa_3days_data(CWA_API_KEY, city_name)
+        raw_hourly_data = hourly_future.result(timeout=_FETCH_RESULT_TIMEOUT)
         if raw_hourly_data:
             parsed_hourly = parse_3days_weather(raw_hourly_data, city_name)
             all_weather_data["hourly_forecast"] = parsed_hourly # 儲存解析後的數據
         else:
             logger.warning(f"未能取得 {city_name} 的未來 3 天天氣預報，將使用預設值。")
+            all_weather_data["is_complete"] = False
     except Exception as e:
         logger.warning(f"處理未來 3 天天氣預報時發生錯誤，但仍將繼續: {e}")
         all_weather_data["hourly_forecast"] = []
+        all_weather_data["is_complete"] = False
 
     # 3. 取得每日紫外線指數 (O-A0005-001)
     try:
         """
         獲取並解析紫外線指數數據。
         與未來 3 天天氣預報類似，這部分數據也是次要的。
-        先呼叫 `get_uv_station_id` 確定應該查詢哪個測站的數據。
-        接著呼叫 `get_today_uvindex_data` 和 `parse_uv_index` 獲取並解析數據。
+        發出請求前已先呼叫 `get_uv_station_id` 確定應該查詢哪個測站的數據；找不到測站時不會發出請求，`parse_uv_index` 會直接回傳「無資料」的預設值。
+        接著取得 `get_today_uvindex_data` 的請求結果，並呼叫 `parse_uv_index` 解析數據。
         如果過程中發生錯誤，會記錄警告日誌並將 `uv_data` 設為 `None`，然後繼續執行。
         確保即使紫外線數據不可用，主功能也不會受影響。
         """
-        station_id = get_uv_station_id(city_name)
-        raw_uv_data = get_today_uvindex_data(CWA_API_KEY)
+        if uv_future is None:
+            logger.warning(f"找不到 {city_name} 對應的紫外線測站，略過紫外線指數查詢。")
+            raw_uv_data = None
+        else:
+            raw_uv_data = uv_future.result(timeout=_FETCH_RESULT_TIMEOUT)
+            if not raw_uv_data:
+                logger.warning(f"未能取得紫外線指數資料，{city_name} 將顯示無資料。")
+                all_weather_data["is_complete"] = False
 
         parsed_uv_data = parse_uv_index(raw_uv_data, station_id)
         all_weather_data["uv_data"] = parsed_uv_data # 儲存解析後的數據
     except Exception as e:
         logger.warning(f"處理紫外線指數時發生錯誤，但仍將繼續: {e}")
         all_weather_data["uv_data"] = None
+        all_weather_data["is_complete"] = False
         
     return all_weather_data
\ No newline at end of file
@@ -13,7 +13,7 @@ from linebot.v3.messaging.models import (
     FlexBox, FlexText, FlexBubble, FlexMessage, FlexSeparator
 )
 
-from utils.flex_message_elements import make_kv_row
+from utils.flex_message_elements import make_kv_row, SUGGESTION_TEXT_STYLE
 
 from outfit_suggestion.today_outfit_logic import get_outfit_suggestion_for_today_weather
 
@@ -54,20 +54,11 @@ def create_daily_weather_flex_message(
     """
     將穿搭建議的文字列表 `suggestion_text` 轉換為一系列的 `FlexText` 物件。
     因為 Flex Message 的內容元件需要是特定的物件（如 `FlexText`）。
-    透過迴圈，為每一條建議文字都生成一個獨立的 `FlexText` 物件，並將其加入列表，以便後續的 `FlexBox` 佈局使用。
+    透過列表生成式，為每一條建議文字都生成一個套用共用樣式 `SUGGESTION_TEXT_STYLE` 的 `FlexText` 物件，以便後續的 `FlexBox` 佈局使用。
     """
-    suggestion_text_contents = []
-    for suggestion in suggestion_text:
-        suggestion_text_contents.append(
-            FlexText(
-                text=suggestion,
-                size="md",
-                color="#333333",
-                wrap=True, # 確保文字在超出範圍時自動換行
-                margin="sm",
-                align="start"
-            )
-        )
+    suggestion_text_contents = [
+        FlexText(text=suggestion, **SUGGESTION_TEXT_STYLE) for suggestion in suggestion_text
+    ]
 
     # --- 天氣資訊區塊內容 ---
     """
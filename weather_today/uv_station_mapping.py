@@ -6,6 +6,7 @@
 2. 提供查詢函式：提供一個 `get_uv_station_id` 函式，根據用戶輸入的城市名稱，從映射表中查找並返回對應的測站 ID。
 3. 處理別名：處理常見的城市別名，例如將「台中市」對應到「臺中市」的測站 ID。
 """
+from functools import lru_cache
 from utils.text_processing import normalize_city_name
 
 # --- 台灣主要縣市與其代表性紫外線測站 ID 的映射表 ---
@@ -49,6 +50,8 @@ UV_STATION_MAPPING = {
 }
 
 # --- 根據城市名稱獲取對應的紫外線測站 ID ---
+# 映射表在執行期間不會變動，查詢結果（包含找不到測站的 None）可以直接快取
+@lru_cache(maxsize=64)
 def get_uv_station_id(city_name: str) -> str | None:
     """
     嘗試精確匹配用戶輸入的城市名稱。
@@ -62,9 +65,9 @@ def get_uv_station_id(city_name: str) -> str | None:
     """
     # 嘗試精確匹配用戶輸入的城市
     station_id = UV_STATION_MAPPING.get(city_name)
+    if station_id:
+        return station_id
 
-    # 處理標準化後的名稱
+    # 精確匹配失敗時，才處理標準化後的名稱
     normalized_location_name = normalize_city_name(city_name)
-    station_id = UV_STATION_MAPPING.get(normalized_location_name)
-
-    return station_id
\ No newline at end of file
+    return UV_STATION_MAPPING.get(normalized_location_name)
\ No newline at end of file
@@ -10,6 +10,7 @@
 import logging
 from collections import Counter
 from datetime import datetime, timedelta
+from utils.text_processing import WEEKDAYS_CHINESE
 
 logger = logging.getLogger(__name__)
 
@@ -54,11 +55,10 @@ def parse_today_weather(raw_data: dict, location_name: str) -> dict | None:
     
     # --- 日期和星期幾的格式化 ---
     today = datetime.now() # 獲取當前日期
-    date_formatted = today.strftime("%Y年%m月%d日") # 格式化為「年/月/日」
+    date_formatted = f"{today.year}年{today.month:02d}月{today.day:02d}日" # 格式化為「年/月/日」
     
     # 將 0-6 的數字轉換為中文的星期幾
-    weekdays_chinese = ["一", "二", "三", "四", "五", "六", "日"]
-    weekday_chinese = weekdays_chinese[today.weekday()] # .weekday() 返回 0-6，0 是星期一
+    weekday_chinese = WEEKDAYS_CHINESE[today.weekday()] # .weekday() 返回 0-6，0 是星期一
 
     # 組合成一個完整的日期字串
     full_date_string = f"日期：{date_formatted} ({weekday_chinese})"
@@ -39,7 +39,7 @@ def get_weekend_forecast_flex_messages(parsed_full_forecast_data: Dict) -> List[
     """
     從完整的七天預報數據中，精確的找出週末的數據。
     """
-    # 獲取所有預報日的聚合數據
+    # 逐日獲取聚合數據（產生器），找到週末兩天後停止迭代，之後的日期不會被聚合
     all_aggregated_data = _aggregate_parsed_forecast_data(parsed_full_forecast_data)
     weekend_aggregated_data: List[Dict] = []
 
@@ -4,7 +4,7 @@
 主要職責：
 1. 處理 Postback 事件：當用戶點擊 LINE 上的「週末天氣」按鈕時，`handle_weekend_weather_postback` 函式會被觸發。
 2. 查詢用戶設定：根據用戶的 ID 從資料庫中獲取設定的預設城市；如果沒有設定，則使用一個預設值。
-3. 整合外部服務：調用中央氣象署 API 獲取天氣數據，並使用 `weather_forecast_parser` 和 `weekend_forecast_converter` 等工具來解析和處理這些數據。
+3. 整合外部服務：透過與未來預報功能共用的 `fetch_and_parse_forecast_data` 獲取並解析天氣數據，再使用 `weekend_forecast_converter` 處理這些數據。
 4. 動態生成 Flex Message：將處理好的天氣數據轉換為美觀的 Flex Message，特別是使用 `FlexCarousel` 來展示多天的預報卡片。
 5. 訊息發送：最終將生成的訊息通過 LINE Messaging API 發送給用戶。
 """
@@ -12,14 +12,11 @@ import logging
 from typing import List, Optional
 from linebot.v3.messaging.models import Message, TextMessage, FlexMessage, FlexCarousel
 
-from config import CWA_API_KEY
-
 from utils.firestore_manager import get_default_city
 from utils.text_processing import normalize_city_name
 from utils.line_common_messaging import send_line_reply_message
 
-from weather_forecast.cwa_forecast_api import get_cwa_forecast_data
-from weather_forecast.weather_forecast_parser import parse_forecast_weather
+from weather_forecast.postback_handler import fetch_and_parse_forecast_data
 from weekend_weather.weekend_forecast_converter import get_weekend_forecast_flex_messages 
 
 logger = logging.getLogger(__name__)
@@ -28,7 +25,8 @@ logger = logging.getLogger(__name__)
 def create_weekend_weather_message(county_name: str) -> Optional[List[Message]]:
     """
     生成週末天氣訊息的核心邏輯。
-    首先獲取中央氣象署的七天預報數據，然後進行解析，接著調用專門的轉換器來篩選週末數據並生成 Flex Message 氣泡。
+    首先獲取並解析中央氣象署的七天預報數據，接著調用專門的轉換器來篩選週末數據並生成 Flex Message 氣泡。
+    獲取與解析使用和未來預報、未來穿搭建議相同的 `fetch_and_parse_forecast_data`，同一個城市的預報在有效時間內只需要請求和解析一次。
     最終將這些氣泡組合成一個 `FlexCarousel` 物件，並返回一個可以發送的訊息列表。
     如果任何步驟失敗，返回一個適當的錯誤訊息。
     """
@@ -36,17 +34,14 @@ def create_weekend_weather_message(county_name: str) -> Optional[List[Message]]:
         # 對城市名稱進行標準化，確保與 API 查詢的格式一致
         normalized_location_name = normalize_city_name(county_name)
 
-        # 1. 從中央氣象署 API 獲取天氣預報數據
-        cwa_data = get_cwa_forecast_data(CWA_API_KEY, normalized_location_name)
-        # 檢查 cwa_data 是否為空或沒有 'records' 鍵
-        if not cwa_data or not cwa_data.get("records"):
+        # 1. 獲取並解析天氣預報數據
+        parsed_forecast_weather = fetch_and_parse_forecast_data(normalized_location_name)
+        if not parsed_forecast_weather:
             logger.warning(f"無法取得 {county_name} 的天氣預報資訊。API 返回空數據或無效格式。")
             return [TextMessage(text=f"抱歉，無法取得 {county_name} 的天氣預報資訊。")]
-        
-        # 2. 解析並格式化天氣數據
-        parsed_forecast_weather = parse_forecast_weather(cwa_data, normalized_location_name)
-        # 再次檢查結果是否有效
-        if not parsed_forecast_weather or not parsed_forecast_weather.get("forecast_periods"):
+
+        # 2. 檢查解析結果中是否有可用的預報時段
+        if not parsed_forecast_weather.get("forecast_periods"):
             logger.error(f"無法從取得的週末天氣資料中解析或格式化出 {normalized_location_name} 的天氣資訊。")
             return [TextMessage(text=f"抱歉，無法顯示 {normalized_location_name} 的天氣資訊卡片。請稍候再試。")]
 
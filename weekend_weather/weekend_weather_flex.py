@@ -10,13 +10,28 @@
 import logging
 from typing import Any, Dict, Optional
 from linebot.v3.messaging.models import (
-    FlexBox, FlexText, FlexImage, FlexBubble, FlexSeparator
+    FlexBox, FlexText, FlexBubble
 )
 
-from utils.flex_message_elements import make_kv_row
+from utils.flex_message_elements import make_kv_row, make_outfit_hero, SUGGESTION_TEXT_STYLE, SECTION_SEPARATOR
 
 logger = logging.getLogger(__name__)
 
+# --- 卡片中固定不變的元件 ---
+"""
+底部的提示文字沒有任何動態內容，在模組載入時建立一次，每張週末卡片直接引用同一個物件（分隔線使用 `utils/flex_message_elements.py` 的共用物件）。
+週末推播會為每個城市產生卡片，共用這些物件可以減少每張卡片需要建立並驗證的 Flex 元件數量。
+發送時 SDK 只會讀取這些物件來序列化，不會修改它們，因此可以安全的在多則訊息之間共用。
+"""
+_FOOTER_TIP_TEXT = FlexText(
+    text="💡 查詢其他縣市，請點選「未來預報」。",
+    size="sm",
+    color="#999999",
+    wrap=True,
+    margin="md",
+    align="center"
+)
+
 def build_weekend_weather_flex(outfit_info: dict, day_data: Dict[str, Any], county_name: str) -> Optional[FlexBubble]:
     """
     根據單日週末天氣資料建立一個 Flex Message 氣泡。
@@ -52,20 +67,11 @@ def build_weekend_weather_flex(outfit_info: dict, day_data: Dict[str, Any], coun
     """
     將穿搭建議的文字列表 `suggestion_text` 轉換為一系列的 `FlexText` 物件。
     因為 Flex Message 的內容元件需要是特定的物件（如 `FlexText`）。
-    透過迴圈，為每一條建議文字都生成一個獨立的 `FlexText` 物件，並將其加入列表，以便後續的 `FlexBox` 佈局使用。
+    透過列表生成式，為每一條建議文字都生成一個套用共用樣式 `SUGGESTION_TEXT_STYLE` 的 `FlexText` 物件，以便後續的 `FlexBox` 佈局使用。
     """
-    suggestion_text_contents = []
-    for suggestion in suggestion_text:
-        suggestion_text_contents.append(
-            FlexText(
-                text=suggestion,
-                size="md",
-                color="#333333",
-                wrap=True, # 確保文字在超出範圍時自動換行
-                margin="sm",
-                align="start"
-            )
-        )
+    suggestion_text_contents = [
+        FlexText(text=suggestion, **SUGGESTION_TEXT_STYLE) for suggestion in suggestion_text
+    ]
 
     # --- 構建 Flex Bubble ---
     """
@@ -76,18 +82,8 @@ def build_weekend_weather_flex(outfit_info: dict, day_data: Dict[str, Any], coun
     """
     flex_bubble_object = FlexBubble(
         direction="ltr",
-        hero=FlexBox(
-            layout="vertical", # 內容垂直排列
-            # --- 圖片 ---
-            contents=[
-                FlexImage(
-                    url=suggestion_image_url, 
-                    size="full",
-                    aspectRatio="20:9",
-                    aspectMode="fit"
-                )
-            ]
-        ),
+        # --- 圖片 ---
+        hero=make_outfit_hero(suggestion_image_url),
         body=FlexBox(
             layout="vertical",
             contents=[
@@ -108,30 +104,25 @@ def build_weekend_weather_flex(outfit_info: dict, day_data: Dict[str, Any], coun
                         align="center",
                         margin="none"
                     ),
-                FlexSeparator(margin="md"), # 分隔線
+                SECTION_SEPARATOR, # 分隔線
                 # --- 天氣資訊 ---
                 FlexBox(
                     layout="vertical",
                     margin="lg",
                     spacing="sm", # 行與行之間有小間距
+                    # 溫度的三行與其他資訊使用相同的排列方式和間距，直接放在同一層，不需要額外包一層 FlexBox
                     contents=[
                         make_kv_row("🌈 天氣狀況：", day_data.get("display_weather_desc")),
-                        FlexBox(
-                            layout="vertical",
-                            spacing="sm",
-                            contents=[
-                                make_kv_row("🌡️ 最高溫度：", day_data.get("display_max_temp")),
-                                make_kv_row("❄️ 最低溫度：", day_data.get("display_min_temp")),
-                                make_kv_row("    (體感：", f"{day_data.get('display_feels_like_temp')})")
-                            ]
-                        ),
+                        make_kv_row("🌡️ 最高溫度：", day_data.get("display_max_temp")),
+                        make_kv_row("❄️ 最低溫度：", day_data.get("display_min_temp")),
+                        make_kv_row("    (體感：", f"{day_data.get('display_feels_like_temp')})"),
                         make_kv_row("💧 濕度：", day_data.get("display_humidity")),
                         make_kv_row("🌧️ 降雨機率：", day_data.get("display_pop")),
                         make_kv_row("🌬️ 風速：", day_data.get("display_wind_speed")),
                         make_kv_row("☀️ 紫外線指數:", day_data.get("display_uv_index"))
                     ]
                 ),
-                FlexSeparator(margin="md"),
+                SECTION_SEPARATOR,
                 # --- 穿搭建議 ---
                 FlexBox(
                     layout="vertical",
@@ -139,16 +130,9 @@ def build_weekend_weather_flex(outfit_info: dict, day_data: Dict[str, Any], coun
                     margin="md",
                     contents=suggestion_text_contents
                 ),
-                FlexSeparator(margin="md"),
+                SECTION_SEPARATOR,
                 # --- 提示文字 ---
-                FlexText(
-                    text="💡 查詢其他縣市，請點選「未來預報」。",
-                    size="sm",
-                    color="#999999",
-                    wrap=True,
-                    margin="md",
-                    align="center"
-                )
+                _FOOTER_TIP_TEXT
             ]
         )
     )